@@ -0,0 +1,11 @@
+"""
+Pytest configuration.
+
+Puts the project root on sys.path so tests can import core/services/utils
+without each test module patching the path itself.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
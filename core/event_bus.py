@@ -28,7 +28,23 @@ except ImportError:
     def pyqtSignal(*args):
         return SimpleSignal(*args)
 
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple
+
+
+@dataclass(slots=True, frozen=True)
+class SpreadUpdate:
+    """Per-tick spread snapshot emitted by LiveMonitor."""
+    symbol: str
+    gross_spread: float
+    gross_spread_pct: float
+    fee_cost: float
+    fee_pct: float
+    net_spread: float
+    net_spread_pct: float
+    z_score: float
+    mid_price: float
+    exchanges: Tuple[str, str]
 
 
 class EventBus(QObject):
@@ -44,7 +60,7 @@ class EventBus(QObject):
     
     # Signal definitions
     price_updated = pyqtSignal(dict)
-    spread_updated = pyqtSignal(dict)
+    spreads_updated_batch = pyqtSignal(list)
     signal_triggered = pyqtSignal(str, str, float, str, str)
     trade_opened = pyqtSignal(dict)
     trade_closed = pyqtSignal(dict)
@@ -67,7 +83,7 @@ class EventBus(QObject):
             # if we want multiple EventBus instances (though it's a singleton).
             # To match PyQt behavior where signals are defined once:
             self.price_updated = SimpleSignal(dict)
-            self.spread_updated = SimpleSignal(dict)
+            self.spreads_updated_batch = SimpleSignal(list)
             self.signal_triggered = SimpleSignal(str, str, float, str, str)
             self.trade_opened = SimpleSignal(dict)
             self.trade_closed = SimpleSignal(dict)
@@ -106,6 +122,15 @@ class EventBus(QObject):
         """
         self.price_updated.emit(data)
     
+    def emit_spread_batch(self, updates: List[SpreadUpdate]) -> None:
+        """
+        Emit a batch of spread updates collected over a short window.
+        
+        Args:
+            updates: List of SpreadUpdate snapshots (oldest first)
+        """
+        self.spreads_updated_batch.emit(updates)
+    
     def emit_signal_triggered(self, symbol: str, signal_type: str, z_score: float, ex_a: str = '', ex_b: str = '') -> None:
         """
         Emit a trading signal event.
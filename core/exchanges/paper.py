@@ -12,6 +12,12 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from core.interfaces.exchange import BaseExchange
 from utils.logger import get_logger
 
@@ -68,8 +74,7 @@ class PaperExchange(BaseExchange):
         """Load state from JSON file if it exists."""
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
+                state = self._read_state_file()
                 
                 # Load state for this exchange
                 exchange_state = state.get(self.exchange_name, {})
@@ -84,6 +89,13 @@ class PaperExchange(BaseExchange):
             except Exception as e:
                 self.logger.error(f"Failed to load state: {e}")
     
+    def _read_state_file(self) -> Dict:
+        """Parse the shared state file (orjson when available)."""
+        if HAS_ORJSON:
+            return orjson.loads(self.state_file.read_bytes())
+        with open(self.state_file, 'r') as f:
+            return json.load(f)
+    
     def _save_state(self) -> None:
         """Save current state to JSON file."""
         try:
@@ -92,8 +104,7 @@ class PaperExchange(BaseExchange):
             
             # Load existing state
             if self.state_file.exists():
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
+                state = self._read_state_file()
             else:
                 state = {}
             
@@ -105,8 +116,13 @@ class PaperExchange(BaseExchange):
             }
             
             # Save to file
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            if HAS_ORJSON:
+                self.state_file.write_bytes(
+                    orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+                )
+            else:
+                with open(self.state_file, 'w') as f:
+                    json.dump(state, f, indent=2)
             
             self.logger.debug(f"📄 Saved state for {self.exchange_name}")
         
@@ -16,6 +16,15 @@ import sys
 
 import aiohttp
 from aiohttp import WSMsgType
+
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers below work with both
+    from orjson import loads as json_loads
+    HAS_ORJSON = True
+except ImportError:
+    from json import loads as json_loads
+    HAS_ORJSON = False
+
 from utils.logger import get_logger
 from core.event_bus import EventBus
 from utils.config import get_config
@@ -51,6 +60,7 @@ class WebSocketManager:
         self.message_queue: asyncio.Queue = asyncio.Queue(
             maxsize=self.config['websocket'].get('message_queue_size', 1000)
         )
+        self.dropped_messages = 0  # Stale ticks evicted because the queue was full
         
         # Latest prices cache
         self.latest_prices: Dict[str, Dict[str, Dict]] = defaultdict(dict)
@@ -186,17 +196,17 @@ class WebSocketManager:
                                 # Check if it's a server ping from BingX - respond with Pong
                                 if msg.data.strip().lower() == "ping":
                                     await ws.send_str("Pong")
-                                    self.logger.debug(f"Received Ping from {exchange_name}, sent Pong")
+                                    self.logger.debug("Received Ping from %s, sent Pong", exchange_name)
                                     continue
                                 
                                 # Check if it's our own Pong echo
                                 if msg.data.strip().lower() == "pong":
-                                    self.logger.debug(f"Received Pong echo from {exchange_name}")
+                                    self.logger.debug("Received Pong echo from %s", exchange_name)
                                     continue
                                 
                                 # Otherwise parse as JSON
                                 try:
-                                    data = json.loads(msg.data)
+                                    data = json_loads(msg.data)
                                     await self._handle_message(exchange_name, data)
                                 except json.JSONDecodeError as e:
                                     self.logger.error(f"JSON decode error from {exchange_name}: {e}")
@@ -212,29 +222,29 @@ class WebSocketManager:
                                     # Check if it's a server ping from BingX - respond with Pong
                                     if decompressed.lower() == "ping":
                                         await ws.send_str("Pong")
-                                        self.logger.debug(f"Received Ping (binary) from {exchange_name}, sent Pong")
+                                        self.logger.debug("Received Ping (binary) from %s, sent Pong", exchange_name)
                                         continue
                                     
                                     # Check if it's a Pong echo or empty
                                     if not decompressed or decompressed.lower() == "pong":
-                                        self.logger.debug(f"Received Pong/empty from {exchange_name}")
+                                        self.logger.debug("Received Pong/empty from %s", exchange_name)
                                         continue
                                     
                                     # Try to parse as JSON
                                     try:
-                                        data = json.loads(decompressed)
+                                        data = json_loads(decompressed)
                                         
                                         # HTX sends ping in JSON format, respond with pong
                                         if exchange_name == 'htx' and 'ping' in data:
                                             pong_msg = {"pong": data["ping"]}
                                             await ws.send_json(pong_msg)
-                                            self.logger.debug(f"Received HTX ping {data['ping']}, sent pong")
+                                            self.logger.debug("Received HTX ping %s, sent pong", data['ping'])
                                             continue
                                         
                                         await self._handle_message(exchange_name, data)
                                     except json.JSONDecodeError:
                                         # Not JSON, might be another heartbeat format
-                                        self.logger.debug(f"Non-JSON message from {exchange_name}: {decompressed[:50]}")
+                                        self.logger.debug("Non-JSON message from %s: %s", exchange_name, decompressed[:50])
                                         continue
                                         
                                 except gzip.BadGzipFile as e:
@@ -406,7 +416,7 @@ class WebSocketManager:
             
             if exchange_name == 'bingx':
                 # Debug: Log raw BingX payload
-                self.logger.debug(f"Raw BingX payload: {message}")
+                self.logger.debug("Raw BingX payload: %s", message)
                 
                 # BingX message format
                 if 'dataType' in message and '@ticker' in message.get('dataType', ''):
@@ -639,15 +649,24 @@ class WebSocketManager:
                 # Update cache
                 self.latest_prices[exchange_name][normalized_data['symbol']] = normalized_data
                 
-                # Put in queue (non-blocking)
+                # Put in queue (non-blocking). When full, drop the oldest tick:
+                # consumers only care about the latest price per symbol.
                 try:
                     self.message_queue.put_nowait(normalized_data)
                 except asyncio.QueueFull:
-                    self.logger.warning(f"Message queue full, dropping message for {normalized_data['symbol']}")
+                    self.message_queue.get_nowait()
+                    self.message_queue.put_nowait(normalized_data)
+                    self.dropped_messages += 1
+                    if self.dropped_messages % 1000 == 1:
+                        self.logger.warning(
+                            f"Message queue full, dropping stale ticks "
+                            f"({self.dropped_messages} dropped so far)"
+                        )
                 
                 self.logger.debug(
-                    f"{exchange_name} {normalized_data['symbol']}: "
-                    f"bid={normalized_data['bid']}, ask={normalized_data['ask']}"
+                    "%s %s: bid=%s, ask=%s",
+                    exchange_name, normalized_data['symbol'],
+                    normalized_data['bid'], normalized_data['ask']
                 )
         
         except Exception as e:
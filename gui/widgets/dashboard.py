@@ -21,7 +21,7 @@ import pyqtgraph as pg
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core.event_bus import EventBus
+from core.event_bus import EventBus, SpreadUpdate
 
 
 class Dashboard(QWidget):
@@ -124,7 +124,7 @@ class Dashboard(QWidget):
         """Connect to EventBus signals."""
         bus = EventBus.instance()
         bus.price_updated.connect(self._on_price_update)
-        bus.spread_updated.connect(self._on_spread_update)
+        bus.spreads_updated_batch.connect(self._on_spreads_batch)
         bus.connection_status.connect(self._on_connection_status)
     
     @pyqtSlot(dict)
@@ -158,21 +158,27 @@ class Dashboard(QWidget):
             price = data.get('last', 0)
             self.table_data_buffer[symbol]['bybit_price'] = price
     
-    @pyqtSlot(dict)
-    def _on_spread_update(self, data: dict):
+    @pyqtSlot(list)
+    def _on_spreads_batch(self, updates: list):
+        """
+        Handle a batch of spread/Z-Score updates from EventBus.
+        
+        Args:
+            updates: List of SpreadUpdate snapshots (oldest first)
+        """
+        for data in updates:
+            self._on_spread_update(data)
+    
+    def _on_spread_update(self, data: SpreadUpdate):
         """
         Handle spread/Z-Score update from EventBus.
         
         Args:
-            data: Dictionary with spread data including:
-                - symbol: Trading pair
-                - net_spread_pct: Net spread percentage
-                - z_score: Z-Score value
+            data: SpreadUpdate snapshot for a single tick
         """
-        # Extract data from dictionary
-        symbol = data.get('symbol', '')
-        z_score = data.get('z_score', 0.0)
-        net_spread_pct = data.get('net_spread_pct', 0.0)
+        symbol = data.symbol
+        z_score = data.z_score
+        net_spread_pct = data.net_spread_pct
         
         # Ensure row exists
         if symbol not in self.rows:
@@ -14,7 +14,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSlot
 from PyQt6.QtGui import QColor, QBrush
 
-from core.event_bus import EventBus
+from core.event_bus import EventBus, SpreadUpdate
 from utils.logger import get_logger
 
 
@@ -94,7 +94,7 @@ class MonitorTable(QWidget):
         """Connect to EventBus signals."""
         bus = EventBus.instance()
         bus.price_updated.connect(self._on_price_updated)
-        bus.spread_updated.connect(self._on_spread_updated)
+        bus.spreads_updated_batch.connect(self._on_spreads_batch)
     
     @pyqtSlot(dict)
     def _on_price_updated(self, data: dict):
@@ -132,26 +132,33 @@ class MonitorTable(QWidget):
             self.logger.error(f"Error handling price update: {e}")
     
     
-    @pyqtSlot(dict)
-    def _on_spread_updated(self, data: dict):
+    @pyqtSlot(list)
+    def _on_spreads_batch(self, updates: list):
+        """
+        Handle a batch of spread updates from EventBus.
+        
+        Only the latest update per symbol is rendered since the table shows current values.
+        
+        Args:
+            updates: List of SpreadUpdate snapshots (oldest first)
+        """
+        latest = {data.symbol: data for data in updates}
+        for data in latest.values():
+            self._on_spread_updated(data)
+    
+    def _on_spread_updated(self, data: SpreadUpdate):
         """
         Handle spread update from EventBus.
         
         Args:
-            data: Dictionary with spread data including:
-                - symbol: Trading pair
-                - gross_spread_pct: Gross spread percentage
-                - fee_pct: Total fee percentage
-                - net_spread_pct: Net spread percentage (gross - fees)
-                - z_score: Z-Score value
+            data: SpreadUpdate snapshot (symbol, gross/fee/net spread %, Z-Score)
         """
         try:
-            # Extract data from dictionary
-            symbol = data.get('symbol', '')
-            gross_spread_pct = data.get('gross_spread_pct', 0.0)
-            fee_pct = data.get('fee_pct', 0.0)
-            net_spread_pct = data.get('net_spread_pct', 0.0)
-            zscore = data.get('z_score', 0.0)
+            symbol = data.symbol
+            gross_spread_pct = data.gross_spread_pct
+            fee_pct = data.fee_pct
+            net_spread_pct = data.net_spread_pct
+            zscore = data.z_score
             
             if not symbol:
                 return
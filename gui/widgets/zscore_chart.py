@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import pyqtSlot
 from PyQt6.QtGui import QColor
 
-from core.event_bus import EventBus
+from core.event_bus import EventBus, SpreadUpdate
 from utils.logger import get_logger
 
 
@@ -116,24 +116,31 @@ class ZScoreChart(QWidget):
     def _connect_signals(self):
         """Connect to EventBus signals."""
         bus = EventBus.instance()
-        bus.spread_updated.connect(self._on_spread_updated)
+        bus.spreads_updated_batch.connect(self._on_spreads_batch)
     
     
-    @pyqtSlot(dict)
-    def _on_spread_updated(self, data: dict):
+    @pyqtSlot(list)
+    def _on_spreads_batch(self, updates: list):
+        """
+        Handle a batch of spread updates from EventBus.
+        
+        Args:
+            updates: List of SpreadUpdate snapshots (oldest first)
+        """
+        for data in updates:
+            self._on_spread_updated(data)
+    
+    def _on_spread_updated(self, data: SpreadUpdate):
         """
         Handle spread update from EventBus.
         
         Only updates if symbol matches selected symbol.
         
         Args:
-            data: Dictionary with spread data including:
-                - symbol: Trading pair
-                - z_score: Z-Score value
+            data: SpreadUpdate snapshot for a single tick
         """
-        # Extract data from dictionary
-        symbol = data.get('symbol', '')
-        zscore = data.get('z_score', 0.0)
+        symbol = data.symbol
+        zscore = data.z_score
         
         # Only update for selected symbol
         if self.selected_symbol is None or symbol != self.selected_symbol:
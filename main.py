@@ -126,10 +126,17 @@ def run_scanner(args):
     """
     logger.info("Running market scanner...")
     try:
+        import asyncio
         from services.market_scanner import MarketScanner
         
-        scanner = MarketScanner(config_path=args.config)
-        results = scanner.scan()
+        async def run_scan():
+            scanner = MarketScanner(config_path=args.config)
+            try:
+                return await scanner.scan()
+            finally:
+                await scanner.close()
+        
+        results = asyncio.run(run_scan())
         
         logger.info(f"Scan complete. Found {len(results)} profitable pairs")
         logger.info("Results saved to config/whitelist.json")
@@ -179,6 +186,9 @@ def run_telegram_manager(args):
         import asyncio
         from services.telegram_manager import TelegramSignalManager
         from services.execution import ExecutionEngine
+        from utils.event_loop import install_uvloop
+        
+        logger.info(f"Event loop policy: {install_uvloop()}")
         
         manager = TelegramSignalManager(config_path=args.config)
         
@@ -145,7 +145,22 @@ class ExecutionEngine:
     def _handle_signal(self, symbol: str, signal_type: str, z_score: float, ex_a: str = '', ex_b: str = '') -> None:
         """
         Handle trading signal from EventBus.
+        
+        EventBus delivers signals synchronously; a Task is only scheduled for
+        signals that can actually lead to exchange I/O.
         """
+        # Cheap state checks first so no-op signals don't allocate a Task
+        if signal_type == 'ENTRY' and (
+            self.is_busy
+            or symbol in self.active_trades
+            or len(self.active_trades) >= self.max_positions
+        ):
+            self.logger.debug(f"Ignoring ENTRY for {symbol}: engine busy or at capacity")
+            return
+        if signal_type == 'EXIT' and symbol not in self.active_trades:
+            self.logger.debug(f"Ignoring EXIT for {symbol}: no active trade")
+            return
+        
         # Run async handler in event loop
         asyncio.create_task(self._process_signal(symbol, signal_type, z_score, ex_a, ex_b))
     
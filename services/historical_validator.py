@@ -5,7 +5,9 @@ Validates arbitrage opportunities using historical data analysis.
 Performs stationarity tests, Z-Score analysis, and profitability assessment.
 """
 
+import asyncio
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 from datetime import datetime
@@ -28,7 +30,7 @@ import yaml
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from utils.metrics import calculate_z_score, adf_test, calculate_spread, calculate_spread_stats
+from utils.metrics import calculate_z_score, adf_test, calculate_spread, calculate_spread_stats, spread_statistics, warm_up as warm_up_metrics
 from utils.logger import get_logger
 from utils.symbol_resolver import SymbolResolver
 
@@ -55,12 +57,29 @@ class HistoricalValidator:
         self.exchanges = self._setup_exchanges()
         self.resolver = SymbolResolver(self.config)
         
+        # Optional executor (e.g. ProcessPoolExecutor) for the CPU-bound ADF/Z-Score step;
+        # None runs it inline on the event loop
+        self.executor: Optional[Executor] = None
+        
+        # The CCXT clients are synchronous: their calls run in worker threads, one
+        # at a time per exchange (a client and its rate limiter are not thread-safe)
+        self._exchange_locks: Dict[str, asyncio.Lock] = {}
+        
         # Track last analyzed exchanges for plotting
         self._last_ex_a = 'bingx'
         self._last_ex_b = 'bybit'
         
         self.logger.info("HistoricalValidator initialized successfully")
     
+    def warmup(self) -> None:
+        """
+        Compile (or load from the on-disk cache) the ADF and Z-Score kernels in this process.
+        
+        Blocking; run it off the event loop (e.g. asyncio.to_thread) at startup so
+        the first validated signal does not pay the JIT cost.
+        """
+        warm_up_metrics()
+    
     def _load_config(self, config_path: str) -> dict:
         """
         Load configuration from YAML file.
@@ -148,6 +167,13 @@ class HistoricalValidator:
             self.logger.error(f"Error setting up exchanges: {e}")
             raise
     
+    def _exchange_lock(self, ex_id: str) -> asyncio.Lock:
+        """Return the lock serializing calls to one exchange client."""
+        lock = self._exchange_locks.get(ex_id)
+        if lock is None:
+            lock = self._exchange_locks[ex_id] = asyncio.Lock()
+        return lock
+    
     async def fetch_ohlcv(
         self,
         exchange: ccxt.Exchange,
@@ -157,6 +183,9 @@ class HistoricalValidator:
     ) -> Optional[pd.DataFrame]:
         """
         Fetch historical OHLCV data from exchange with pagination support.
+        
+        The blocking CCXT requests run in a worker thread, holding the exchange's
+        lock, so the event loop keeps serving other tasks meanwhile.
         """
         ex_id = exchange.id
         
@@ -178,12 +207,14 @@ class HistoricalValidator:
             while len(all_ohlcv) < limit:
                 fetch_limit = min(limit - len(all_ohlcv), 1000)
                 try:
-                    ohlcv = exchange.fetch_ohlcv(
-                        resolved_symbol,
-                        timeframe,
-                        since=since,
-                        limit=fetch_limit
-                    )
+                    async with self._exchange_lock(ex_id):
+                        ohlcv = await asyncio.to_thread(
+                            exchange.fetch_ohlcv,
+                            resolved_symbol,
+                            timeframe,
+                            since=since,
+                            limit=fetch_limit
+                        )
                     if not ohlcv:
                         break
                     
@@ -240,13 +271,16 @@ class HistoricalValidator:
                     ex_class = getattr(ccxt, ex_id)
                     ex_config = self.config.get('exchanges', {}).get(ex_id, {})
                     
-                    self.exchanges[ex_id] = ex_class({
+                    exchange = ex_class({
                         'enableRateLimit': True,
                         'options': {
                             'defaultType': ex_config.get('default_type', 'swap')
                         }
                     })
-                    await self.exchanges[ex_id].load_markets()
+                    async with self._exchange_lock(ex_id):
+                        await asyncio.to_thread(exchange.load_markets)
+                    # Publish only once markets are loaded
+                    self.exchanges.setdefault(ex_id, exchange)
                 except Exception as e:
                     self.logger.error(f"Failed to initialize {ex_id}: {e}")
                     return {'symbol': symbol, 'error': f'Exchange {ex_id} not supported'}
@@ -259,9 +293,11 @@ class HistoricalValidator:
         
         self.logger.info(f"Analyzing {symbol} on {ex_a}/{ex_b} | {timeframe}, {limit} candles")
         
-        # Fetch data from both exchanges
-        df_a = await self.fetch_ohlcv(self.exchanges[ex_a], symbol, timeframe, limit)
-        df_b = await self.fetch_ohlcv(self.exchanges[ex_b], symbol, timeframe, limit)
+        # Fetch data from both exchanges (different clients, so concurrently)
+        df_a, df_b = await asyncio.gather(
+            self.fetch_ohlcv(self.exchanges[ex_a], symbol, timeframe, limit),
+            self.fetch_ohlcv(self.exchanges[ex_b], symbol, timeframe, limit)
+        )
         
         if df_a is None or df_b is None:
             self.logger.error(f"Failed to fetch data from {ex_a} or {ex_b}")
@@ -300,15 +336,20 @@ class HistoricalValidator:
         df['spread'] = df[f'{ex_a}_close'] - df[f'{ex_b}_close']
         df['spread_pct'] = df['spread'].abs() / df[f'{ex_a}_close']
         
-        # Run ADF test for stationarity
-        is_stationary, adf_pvalue, adf_details = adf_test(df['spread'])
+        # Run ADF test for stationarity and calculate rolling Z-Score
+        z_score_window = self.config['validation']['z_score_window']
+        spread_values = df['spread'].to_numpy()
+        if self.executor is not None:
+            loop = asyncio.get_running_loop()
+            is_stationary, adf_pvalue, z_scores = await loop.run_in_executor(
+                self.executor, spread_statistics, spread_values, z_score_window
+            )
+        else:
+            is_stationary, adf_pvalue, z_scores = spread_statistics(spread_values, z_score_window)
+        df['z_score'] = z_scores
         
         self.logger.info(f"ADF Test: p-value={adf_pvalue:.4f}, stationary={is_stationary}")
         
-        # Calculate Z-Score
-        z_score_window = self.config['validation']['z_score_window']
-        df['z_score'] = calculate_z_score(df['spread'], window=z_score_window)
-        
         # Count signals where |Z-Score| > threshold
         z_threshold = self.config['trading']['z_score_entry']
         z_score_signals = len(df[df['z_score'].abs() > z_threshold])
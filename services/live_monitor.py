@@ -13,25 +13,45 @@ HYBRID APPROACH:
 import asyncio
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
-from collections import deque
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import signal
 import time
 
-import pandas as pd
+import numpy as np
 import ccxt.async_support as ccxt
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from core.ws_manager import WebSocketManager
-from core.event_bus import EventBus
-from utils.metrics import calculate_z_score, calculate_net_spread
+from core.event_bus import EventBus, SpreadUpdate
+from utils._live_kernels import ring_append, warm_up as warm_up_kernels
 from utils.logger import get_logger
 from utils.symbol_resolver import SymbolResolver
 
 
+def _pick_spread(spread_a_to_b: float, spread_b_to_a: float) -> float:
+    """
+    Select the more favorable executable spread, signed by the A->B direction.
+    
+    Equivalent to ``min(abs(a_to_b), abs(b_to_a))`` negated when ``a_to_b < 0``.
+    Note that returning ``-b_to_a`` in the second branch is NOT equivalent:
+    the sign must always follow the A->B leg.
+
+    Args:
+        spread_a_to_b: ask_A - bid_B
+        spread_b_to_a: ask_B - bid_A
+
+    Returns:
+        Signed gross spread (negative means Exchange A cheaper)
+    """
+    abs_ba = abs(spread_b_to_a)
+    if abs(spread_a_to_b) <= abs_ba:
+        return spread_a_to_b
+    return abs_ba if spread_a_to_b > 0 else -abs_ba
+
+
 class LiveMonitor:
     """
     Real-time arbitrage monitoring service with hybrid Z-Score calculation.
@@ -40,6 +60,9 @@ class LiveMonitor:
     historical baseline, and emits trading signals when thresholds are crossed.
     """
     
+    # Seconds between price queue backlog reports
+    BACKLOG_REPORT_INTERVAL = 60.0
+    
     def __init__(self, config_path: str = 'config/config.yaml'):
         """
         Initialize Live Monitor.
@@ -82,16 +105,25 @@ class LiveMonitor:
             for ex_id in self.supported_exchanges
         }
         
-        # Spread history storage (symbol -> deque of historical GROSS spreads)
-        # CRITICAL: This stores GROSS SPREAD (market data), not net spread
-        # Z-Score measures market anomaly, not profitability
-        self.spread_history: Dict[str, deque] = {}
+        # Per-pair fee constants: (ex_a, ex_b) -> (round-trip taker rate, fee_pct)
+        self._pair_fees: Dict[tuple, Tuple[float, float]] = {}
+        
+        # Signal thresholds (cached to keep config dict lookups off the hot path)
+        self._load_signal_params()
         
         # Load Z-Score parameters from config
         monitor_config = self.config.get('monitoring', {})
         self.history_timeframe = monitor_config.get('timeframe', '5m')
         self.history_length = monitor_config.get('history_length', 100)
         
+        # Spread history storage (symbol -> fixed-size ring buffer of historical GROSS spreads)
+        # CRITICAL: This stores GROSS SPREAD (market data), not net spread
+        # Z-Score measures market anomaly, not profitability
+        self.spread_history: Dict[str, np.ndarray] = {}
+        self._hist_n: Dict[str, int] = {}     # symbol -> number of samples written (capped at history_length)
+        self._hist_head: Dict[str, int] = {}  # symbol -> next write position in the ring buffer
+        self._hist_stats: Dict[str, Tuple[float, float]] = {}  # symbol -> (mean, std) of the baseline
+        
         # Calculate update interval based on timeframe
         timeframe_minutes = {
             '1m': 1, '3m': 3, '5m': 5, '15m': 15, '30m': 30, '1h': 60, '4h': 240
@@ -102,7 +134,7 @@ class LiveMonitor:
         self.logger.info(f"Z-Score Config: Timeframe={self.history_timeframe} ({self.timeframe_mins}m), Window={self.history_length} candles")
         
         # Track last history update time for each symbol
-        self.last_history_update: Dict[str, float] = {}
+        self.last_history_update: Dict[str, float] = {}  # time.monotonic() of last baseline append
         
         # Track active exchange pairs for each symbol
         self.active_pairs: Dict[str, tuple] = {}  # symbol -> (ex_a, ex_b)
@@ -110,20 +142,174 @@ class LiveMonitor:
         # Track position state for each symbol
         self.in_position: Dict[str, bool] = {}
         
-        # Price cache for all exchanges
-        self.price_cache: Dict[str, Dict[str, dict]] = {
-            ex: {} for ex in self.supported_exchanges
-        }
+        # Latest quote for all exchanges: (exchange, symbol) -> (bid, ask, last)
+        self.price_cache: Dict[Tuple[str, str], Tuple[float, float, float]] = {}
         
         # Signal persistence counters: symbol -> {'entry': int, 'exit': int}
         self.signal_counters: Dict[str, Dict[str, int]] = {}
         
+        # Quote pair used on the last evaluation: symbol -> (quote_a, quote_b)
+        # Lets _check_arbitrage_opportunity skip ticks that changed neither side
+        self._last_eval_ticks: Dict[str, Tuple[tuple, tuple]] = {}
+        
+        # Latest evaluated snapshot per symbol (read by signal confirmation)
+        self.latest_updates: Dict[str, SpreadUpdate] = {}
+        
+        # Per-symbol events set whenever fresh stats are computed (see stats_event)
+        self._stats_updated: Dict[str, asyncio.Event] = {}
+        
+        # Spread update batching: first update after an idle period is emitted
+        # immediately, subsequent ones within the window are flushed together
+        self.spread_batch_window = monitor_config.get('spread_batch_ms', 20) / 1000.0
+        self._pending_updates: List[SpreadUpdate] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        
+        # Delay after the first tick of a batch before draining the queue (0 = drain immediately)
+        self.tick_coalesce_window = monitor_config.get('tick_coalesce_ms', 0) / 1000.0
+        
+        # Price queue backlog tracking (largest drained batch since last report)
+        self._peak_backlog = 0
+        self._last_backlog_report = time.monotonic()
+        
         # Control
         self.running = False
         self.monitor_task: Optional[asyncio.Task] = None
         
         self.logger.info("LiveMonitor initialized with hybrid Z-Score approach")
     
+    def _load_signal_params(self) -> None:
+        """
+        Read signal thresholds from config into instance attributes.
+        
+        Values are coerced once here so the per-tick comparisons are plain
+        float/int operations, whatever type YAML or env overrides produced.
+        """
+        trading_config = self.config.get('trading', {})
+        self._z_entry = float(trading_config.get('z_score_entry', 2.5))
+        self._z_exit = float(trading_config.get('z_score_exit', 0.5))
+        
+        # Persistence config (defaults: 3 ticks for entry, 5 for exit to be safe)
+        self._min_entry_ticks = int(trading_config.get('min_entry_ticks', 3))
+        self._min_exit_ticks = int(trading_config.get('min_exit_ticks', 5))
+        
+        # Minimum net spread converted to %
+        self._min_spread_pct = float(trading_config.get('min_spread_pct', 0.003)) * 100
+    
+    def _get_pair_fees(self, pair: tuple) -> Tuple[float, float]:
+        """
+        Get cached round-trip taker fees for an exchange pair.
+        
+        Args:
+            pair: Tuple of exchange IDs (ex_a, ex_b)
+            
+        Returns:
+            Tuple of (total_fee_rate, total_fee_pct)
+        """
+        fees = self._pair_fees.get(pair)
+        if fees is None:
+            fee_rate = float(self.fees[pair[0]]['taker']) + float(self.fees[pair[1]]['taker'])
+            fees = (fee_rate, fee_rate * 100.0)
+            self._pair_fees[pair] = fees
+        return fees
+    
+    def _init_history(self, symbol: str, values: Optional[np.ndarray] = None) -> None:
+        """
+        Allocate the ring buffer for a symbol, optionally seeded with historical spreads.
+        
+        Args:
+            symbol: Trading pair symbol
+            values: Initial GROSS spreads (oldest first); only the newest history_length are kept
+        """
+        buf = np.zeros(self.history_length, dtype=np.float64)
+        n = 0
+        if values is not None and len(values):
+            tail = values[-self.history_length:]
+            n = len(tail)
+            buf[:n] = tail
+        self.spread_history[symbol] = buf
+        self._hist_n[symbol] = n
+        self._hist_head[symbol] = n % self.history_length
+        self._refresh_history_stats(symbol)
+    
+    def _append_history(self, symbol: str, value: float) -> None:
+        """
+        Write a GROSS spread into the symbol's ring buffer, overwriting the oldest sample when full.
+        
+        Args:
+            symbol: Trading pair symbol
+            value: GROSS spread to record
+        """
+        head, n, mean, std = ring_append(
+            self.spread_history[symbol], self._hist_head[symbol], self._hist_n[symbol], float(value)
+        )
+        self._hist_head[symbol] = int(head)
+        self._hist_n[symbol] = int(n)
+        self._hist_stats[symbol] = (float(mean), float(std))
+    
+    def _refresh_history_stats(self, symbol: str) -> None:
+        """
+        Recompute the cached baseline mean and (population) std for a symbol.
+        
+        The baseline only changes once per timeframe interval, so ticks read
+        these cached values instead of reducing the buffer every time.
+        
+        Args:
+            symbol: Trading pair symbol
+        """
+        view = self._history_view(symbol)
+        if len(view):
+            self._hist_stats[symbol] = (float(view.mean()), float(view.std()))
+        else:
+            self._hist_stats[symbol] = (0.0, 0.0)
+    
+    def _history_view(self, symbol: str) -> np.ndarray:
+        """
+        Get the filled portion of a symbol's ring buffer (no copy, order not preserved).
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            NumPy view over the recorded GROSS spreads
+        """
+        return self.spread_history[symbol][:self._hist_n[symbol]]
+    
+    def _emit_spread_update(self, payload: SpreadUpdate) -> None:
+        """
+        Queue a spread update for batched emission on the EventBus.
+        
+        When no batching window is open the update is emitted right away and a
+        window is opened; updates arriving inside the window are coalesced into
+        a single batch emitted when it closes.
+        
+        Args:
+            payload: Spread snapshot for a single tick
+        """
+        if self._flush_handle is None:
+            self.event_bus.emit_spread_batch([payload])
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.spread_batch_window, self._flush_spread_updates)
+        else:
+            self._pending_updates.append(payload)
+    
+    def _flush_spread_updates(self) -> None:
+        """
+        Emit all spread updates accumulated during the current batching window.
+        
+        Keeps the window open while updates keep arriving so sustained bursts stay
+        batched; an empty window closes it and restores immediate emission.
+        """
+        if not self._pending_updates:
+            self._flush_handle = None
+            return
+        
+        batch = self._pending_updates
+        self._pending_updates = []
+        self.event_bus.emit_spread_batch(batch)
+        
+        loop = asyncio.get_running_loop()
+        self._flush_handle = loop.call_later(self.spread_batch_window, self._flush_spread_updates)
+    
     async def _preload_history(self, symbol: str, ex_a: str = 'bingx', ex_b: str = 'bybit') -> None:
         """
         Pre-load historical 1-minute candles for baseline spread calculation.
@@ -143,28 +329,36 @@ class LiveMonitor:
                 self.logger.error(f"Invalid exchanges for pre-load: {ex_a}, {ex_b}")
                 return
 
-            # Resolve exchange-specific symbols
-            symbol_a = await self.resolver.resolve(client_a, symbol)
-            symbol_b = await self.resolver.resolve(client_b, symbol)
+            # Resolve exchange-specific symbols (both exchanges concurrently)
+            symbol_a, symbol_b = await asyncio.gather(
+                self.resolver.resolve(client_a, symbol),
+                self.resolver.resolve(client_b, symbol)
+            )
             
             if not symbol_a or not symbol_b:
                 self.logger.warning(f"Could not resolve symbols for pre-loading {symbol}. {ex_a}: {symbol_a}, {ex_b}: {symbol_b}")
-                # Fallback: start with empty deque
-                self.spread_history[symbol] = deque(maxlen=self.history_length)
-                self.last_history_update[symbol] = time.time()
+                # Fallback: start with empty history
+                self._init_history(symbol)
+                self.last_history_update[symbol] = time.monotonic()
                 return
 
-            # Fetch candles from both exchanges
-            candles_a = await client_a.fetch_ohlcv(
-                symbol=symbol_a,
-                timeframe=self.history_timeframe,
-                limit=self.history_length
-            )
+            # Pin both requests to the same window so the timestamps align
+            since_ms = int(time.time() * 1000) - self.history_length * self.timeframe_mins * 60 * 1000
             
-            candles_b = await client_b.fetch_ohlcv(
-                symbol=symbol_b,
-                timeframe=self.history_timeframe,
-                limit=self.history_length
+            # Fetch candles from both exchanges concurrently
+            candles_a, candles_b = await asyncio.gather(
+                client_a.fetch_ohlcv(
+                    symbol=symbol_a,
+                    timeframe=self.history_timeframe,
+                    since=since_ms,
+                    limit=self.history_length
+                ),
+                client_b.fetch_ohlcv(
+                    symbol=symbol_b,
+                    timeframe=self.history_timeframe,
+                    since=since_ms,
+                    limit=self.history_length
+                )
             )
             
             # Ensure we have data from both exchanges
@@ -174,56 +368,37 @@ class LiveMonitor:
                     f"{ex_a}: {len(candles_a) if candles_a else 0}, "
                     f"{ex_b}: {len(candles_b) if candles_b else 0}"
                 )
-                # Fallback: start with empty deque
-                self.spread_history[symbol] = deque(maxlen=self.history_length)
-                self.last_history_update[symbol] = time.time()
+                # Fallback: start with empty history
+                self._init_history(symbol)
+                self.last_history_update[symbol] = time.monotonic()
                 return
             
-            # Convert to DataFrames for easier processing
-            df_a = pd.DataFrame(
-                candles_a,
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            )
-            df_b = pd.DataFrame(
-                candles_b,
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            )
-            
-            # Align by timestamp (use inner join to ensure matching timestamps)
-            df_a['time'] = pd.to_datetime(df_a['timestamp'], unit='ms')
-            df_b['time'] = pd.to_datetime(df_b['timestamp'], unit='ms')
-            
-            df_merged = pd.merge(
-                df_a[['time', 'close']],
-                df_b[['time', 'close']],
-                on='time',
-                suffixes=('_a', '_b')
-            )
+            # Align by timestamp (inner join on candle open time; OHLCV rows are
+            # [timestamp, open, high, low, close, volume])
+            closes_b = {candle[0]: candle[4] for candle in candles_b}
             
             # Calculate historical GROSS spreads: Close_A - Close_B
-            df_merged['gross_spread'] = df_merged['close_a'] - df_merged['close_b']
-            
             # Populate spread_history with GROSS spreads (market data)
-            historical_gross_spreads = df_merged['gross_spread'].tolist()
-            self.spread_history[symbol] = deque(
-                historical_gross_spreads,
-                maxlen=self.history_length
+            historical_gross_spreads = np.fromiter(
+                (candle[4] - closes_b[candle[0]] for candle in candles_a if candle[0] in closes_b),
+                dtype=np.float64
             )
+            self._init_history(symbol, historical_gross_spreads)
             
             # Set initial update time
-            self.last_history_update[symbol] = time.time()
+            self.last_history_update[symbol] = time.monotonic()
             
             self.logger.info(
                 f"✅ Pre-loaded history for {symbol} ({self.history_timeframe}). "
-                f"Got {len(self.spread_history[symbol])} spread values. "
+                f"Got {self._hist_n[symbol]} spread values. "
                 f"Initial Z-Score parameters set."
             )
             
         except Exception as e:
             self.logger.error(f"Error pre-loading history for {symbol}: {e}")
-            # Fallback: start with empty deque and build gradually
-            self.spread_history[symbol] = deque(maxlen=self.history_length)
-            self.last_history_update[symbol] = time.time()
+            # Fallback: start with empty history and build gradually
+            self._init_history(symbol)
+            self.last_history_update[symbol] = time.monotonic()
             self.logger.warning(
                 f"Starting with empty history for {symbol}. "
                 f"Will build baseline slowly."
@@ -232,33 +407,68 @@ class LiveMonitor:
     async def _process_price_updates(self) -> None:
         """
         Continuously process price updates from WebSocket queue.
+        
+        Runs until cancelled by stop(); waiting on the queue directly avoids
+        allocating a timeout Task and timer handle for every message.
+        
+        Each wake-up drains everything already queued (after waiting
+        tick_coalesce_window, if set): only the newest tick per
+        (exchange, symbol) is cached and emitted, and each touched symbol is
+        evaluated once per batch.
         """
         queue = self.ws_manager.get_queue()
+        # Bound emit of the fastest channel: later connect() calls mutate the
+        # same signal object, so this reference never goes stale
+        emit_price = self.event_bus.price_updated.emit
         
         while self.running:
             try:
-                # Get price update with timeout
-                data = await asyncio.wait_for(queue.get(), timeout=1.0)
+                batch = [await queue.get()]
                 
-                # Update price cache
-                exchange = data['exchange']
-                symbol = data['symbol']
+                # Optionally let a burst accumulate so it collapses to one tick per key
+                if self.tick_coalesce_window > 0:
+                    await asyncio.sleep(self.tick_coalesce_window)
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
                 
-                # Only process supported exchanges (BingX vs Bybit arbitrage)
-                if exchange not in self.supported_exchanges:
-                    continue
+                # Backpressure visibility: report the largest backlog seen per interval
+                if len(batch) > self._peak_backlog:
+                    self._peak_backlog = len(batch)
+                now = time.monotonic()
+                if now - self._last_backlog_report >= self.BACKLOG_REPORT_INTERVAL:
+                    self.logger.debug(
+                        "Price queue: peak backlog %d ticks, %d dropped by producer",
+                        self._peak_backlog, self.ws_manager.dropped_messages
+                    )
+                    self._peak_backlog = 0
+                    self._last_backlog_report = now
                 
-                self.price_cache[exchange][symbol] = data
+                # Keep the newest tick per (exchange, symbol), in arrival order
+                latest: Dict[Tuple[str, str], dict] = {}
+                for data in batch:
+                    exchange = data['exchange']
+                    
+                    # Only process supported exchanges (BingX vs Bybit arbitrage)
+                    if exchange not in self.supported_exchanges:
+                        continue
+                    
+                    latest[(exchange, data['symbol'])] = data
                 
-                # Emit price update event
-                self.event_bus.emit_price_update(data)
+                # Update price cache and emit price update events; only symbols
+                # whose own exchange pair received a quote need re-evaluation
+                touched: Dict[str, None] = {}
+                active_pairs = self.active_pairs
+                for key, data in latest.items():
+                    self.price_cache[key] = (data['bid'], data['ask'], data['last'])
+                    emit_price(data)
+                    exchange, symbol = key
+                    pair = active_pairs.get(symbol)
+                    if pair is not None and exchange in pair:
+                        touched[symbol] = None
                 
-                # Check if we have prices from both exchanges
-                await self._check_arbitrage_opportunity(symbol)
-            
-            except asyncio.TimeoutError:
-                # No message received, continue
-                continue
+                # Check each symbol once against the latest prices from both exchanges
+                for symbol in touched:
+                    await self._check_arbitrage_opportunity(symbol)
             
             except Exception as e:
                 self.logger.error(f"Error processing price update: {e}")
@@ -286,93 +496,98 @@ class LiveMonitor:
         ex_a, ex_b = pair
         
         # Check if we have prices from both exchanges
-        price_a = self.price_cache[ex_a].get(symbol)
-        price_b = self.price_cache[ex_b].get(symbol)
+        quote_a = self.price_cache.get((ex_a, symbol))
+        quote_b = self.price_cache.get((ex_b, symbol))
         
-        if not price_a or not price_b:
+        if quote_a is None or quote_b is None:
             return
         
+        # Skip if neither quote changed since the last evaluation (e.g. tick from
+        # an exchange outside this symbol's pair). Each tick stores a fresh tuple.
+        last_ticks = self._last_eval_ticks.get(symbol)
+        if last_ticks is not None and last_ticks[0] is quote_a and last_ticks[1] is quote_b:
+            return
+        self._last_eval_ticks[symbol] = (quote_a, quote_b)
+        
+        bid_a, ask_a, last_a = quote_a
+        bid_b, ask_b, last_b = quote_b
+        
         # === STEP A: CALCULATE GROSS SPREAD ===
         
         # Calculate current executable spread (buy on one, sell on other)
         # Spread = ask_A - bid_B (cost to execute arbitrage)
-        spread_a_to_b = price_a['ask'] - price_b['bid']
-        spread_b_to_a = price_b['ask'] - price_a['bid']
-        
-        # Use the more favorable spread (gross spread)
-        gross_spread = min(abs(spread_a_to_b), abs(spread_b_to_a))
-        if spread_a_to_b < 0:
-            gross_spread = -gross_spread  # Negative spread means Exchange A cheaper
+        # Use the more favorable spread (gross spread); negative means Exchange A cheaper
+        gross_spread = _pick_spread(ask_a - bid_b, ask_b - bid_a)
         
         # === STEP B: CALCULATE NET SPREAD (CRITICAL) ===
         
         # Calculate mid-price for fee calculation
-        mid_price = (price_a['last'] + price_b['last']) / 2.0
-        
-        # Get fees for both exchanges
-        fee_a = self.fees[ex_a]['taker']
-        fee_b = self.fees[ex_b]['taker']
-        
-        # Calculate net spread after fees
-        net_spread_val, net_spread_pct, fee_cost = calculate_net_spread(
-            gross_spread=abs(gross_spread),
-            price=mid_price,
-            taker_fee_a=fee_a,
-            taker_fee_b=fee_b
-        )
+        mid_price = (last_a + last_b) / 2.0
+        
+        # Get round-trip fees for both exchanges
+        fee_rate, fee_pct = self._get_pair_fees(pair)
+        
+        # Calculate net spread after fees (inlined calculate_net_spread)
+        abs_gross = abs(gross_spread)
+        if mid_price > 0:
+            fee_cost = mid_price * fee_rate
+            net_spread_val = abs_gross - fee_cost
+            net_spread_pct = (net_spread_val / mid_price) * 100
+            gross_spread_pct = (abs_gross / mid_price) * 100
+        else:
+            fee_cost = net_spread_val = net_spread_pct = gross_spread_pct = 0.0
         
         # Preserve sign of spread
         if gross_spread < 0:
             net_spread_val = -net_spread_val
             net_spread_pct = -net_spread_pct
         
-        # Calculate gross spread percentage for display
-        gross_spread_pct = (abs(gross_spread) / mid_price) * 100 if mid_price > 0 else 0.0
-        
         
         # === STEP B: CALCULATE Z-SCORE ON GROSS SPREAD ===
         
         # Check if we have historical baseline
-        if symbol not in self.spread_history or len(self.spread_history[symbol]) < 10:
+        if self._hist_n.get(symbol, 0) < 10:
             # Not enough history yet, skip Z-Score calculation
             return
         
         # Calculate Z-Score from historical baseline using GROSS SPREAD
         try:
-            # Get mean and std from historical baseline (which contains GROSS spreads)
-            gross_spreads = list(self.spread_history[symbol])
-            mean = sum(gross_spreads) / len(gross_spreads)
-            
-            # Calculate standard deviation
-            variance = sum((x - mean) ** 2 for x in gross_spreads) / len(gross_spreads)
-            std_dev = variance ** 0.5
+            # Cached mean and (population) std of the historical GROSS spread baseline
+            mean, std_dev = self._hist_stats[symbol]
             
             # Handle zero standard deviation
             if std_dev == 0:
-                self.logger.debug(f"{symbol}: Zero std deviation, setting Z-Score to 0")
+                self.logger.debug("%s: Zero std deviation, setting Z-Score to 0", symbol)
                 z_score = 0.0
             else:
                 # CORRECTED: Calculate Z-Score using GROSS SPREAD (market anomaly)
                 # Z-Score = (current_gross_spread - baseline_mean) / baseline_std
                 z_score = (gross_spread - mean) / std_dev
                 self.logger.debug(
-                    f"{symbol}: Z-Score={z_score:.2f}, "
-                    f"gross_spread={gross_spread:.4f}, mean={mean:.4f}, std={std_dev:.4f}"
+                    "%s: Z-Score=%.2f, gross_spread=%.4f, mean=%.4f, std=%.4f",
+                    symbol, z_score, gross_spread, mean, std_dev
                 )
             
-            # Emit comprehensive spread update with all values
-            self.event_bus.spread_updated.emit({
-                'symbol': symbol,
-                'gross_spread': gross_spread,
-                'gross_spread_pct': gross_spread_pct,
-                'fee_cost': fee_cost,
-                'fee_pct': (fee_a + fee_b) * 100,
-                'net_spread': net_spread_val,
-                'net_spread_pct': net_spread_pct,
-                'z_score': z_score,
-                'mid_price': mid_price,
-                'exchanges': pair
-            })
+            # Emit comprehensive spread update with all values (batched)
+            update = SpreadUpdate(
+                symbol=symbol,
+                gross_spread=gross_spread,
+                gross_spread_pct=gross_spread_pct,
+                fee_cost=fee_cost,
+                fee_pct=fee_pct,
+                net_spread=net_spread_val,
+                net_spread_pct=net_spread_pct,
+                z_score=z_score,
+                mid_price=mid_price,
+                exchanges=pair
+            )
+            self.latest_updates[symbol] = update
+            self._emit_spread_update(update)
+            
+            # Wake anyone awaiting fresh stats for this symbol
+            stats_event = self._stats_updated.get(symbol)
+            if stats_event is not None:
+                stats_event.set()
             
             # Check for entry/exit signals (requires BOTH high Z-Score AND positive net spread)
             await self._check_signals(symbol, z_score, net_spread_val, net_spread_pct)
@@ -387,18 +602,18 @@ class LiveMonitor:
         # === STEP E: HISTORY MAINTENANCE ===
         
         # Update historical baseline based on timeframe interval
-        current_time = time.time()
-        time_since_update = current_time - self.last_history_update.get(symbol, 0)
+        current_time = time.monotonic()
+        time_since_update = current_time - self.last_history_update.get(symbol, 0.0)
         
         if time_since_update >= self.history_update_interval:
             # CORRECTED: Add current GROSS spread to history (market data)
             # Z-Score measures market anomaly, not profitability
-            self.spread_history[symbol].append(gross_spread)
+            self._append_history(symbol, gross_spread)
             self.last_history_update[symbol] = current_time
             
             self.logger.debug(
-                f"{symbol}: Updated historical baseline with GROSS spread "
-                f"(size={len(self.spread_history[symbol])})"
+                "%s: Updated historical baseline with GROSS spread (size=%d)",
+                symbol, self._hist_n[symbol]
             )
     
     async def _check_signals(self, symbol: str, z_score: float, net_spread_val: float, net_spread_pct: float) -> None:
@@ -411,79 +626,157 @@ class LiveMonitor:
             net_spread_val: Net spread value
             net_spread_pct: Net spread percentage
         """
-        z_entry = self.config['trading']['z_score_entry']
-        z_exit = self.config['trading']['z_score_exit']
-        
-        # Get persistence config (defaults: 3 ticks for entry, 5 for exit to be safe)
-        min_entry_ticks = self.config.get('trading', {}).get('min_entry_ticks', 3)
-        min_exit_ticks = self.config.get('trading', {}).get('min_exit_ticks', 5)
+        z_entry = self._z_entry
+        z_exit = self._z_exit
+        min_entry_ticks = self._min_entry_ticks
+        min_exit_ticks = self._min_exit_ticks
         
         # Initialize counters for symbol if needed
-        if symbol not in self.signal_counters:
-            self.signal_counters[symbol] = {'entry': 0, 'exit': 0}
+        counters = self.signal_counters.get(symbol)
+        if counters is None:
+            counters = self.signal_counters[symbol] = {'entry': 0, 'exit': 0}
             
-        if symbol not in self.in_position:
-            self.in_position[symbol] = False
+        in_position = self.in_position.setdefault(symbol, False)
+        
+        # Fast path: most ticks sit in the no-signal zone (below entry when flat,
+        # above exit when in position) and only need the counters cleared
+        abs_z = abs(z_score)
+        if (abs_z >= z_exit) if in_position else (abs_z <= z_entry):
+            if counters['entry'] or counters['exit']:
+                self.logger.debug("%s: Signal lost stability. Resetting counters.", symbol)
+                counters['entry'] = 0
+                counters['exit'] = 0
+            return
         
         # === SIGNAL LOGIC ===
         
         # 1. ENTRY CONDITION
-        min_spread = self.config.get('trading', {}).get('min_spread_pct', 0.003) * 100 # Convert to %
+        min_spread = self._min_spread_pct
         
-        is_entry_condition = (not self.in_position[symbol] and 
-                            abs(z_score) > z_entry and 
+        is_entry_condition = (not in_position and 
+                            abs_z > z_entry and 
                             net_spread_pct > min_spread)
         
         # 2. EXIT CONDITION
-        is_exit_condition = (self.in_position[symbol] and 
-                           abs(z_score) < z_exit)
+        is_exit_condition = (in_position and 
+                           abs_z < z_exit)
 
         # Update Counters
         if is_entry_condition:
-            self.signal_counters[symbol]['entry'] += 1
-            self.signal_counters[symbol]['exit'] = 0  # Reset exit counter
+            counters['entry'] += 1
+            counters['exit'] = 0  # Reset exit counter
         elif is_exit_condition:
-            self.signal_counters[symbol]['exit'] += 1
-            self.signal_counters[symbol]['entry'] = 0 # Reset entry counter
+            counters['exit'] += 1
+            counters['entry'] = 0 # Reset entry counter
         else:
             # Noise / unstable state - reset both
-            if self.signal_counters[symbol]['entry'] > 0 or self.signal_counters[symbol]['exit'] > 0:
-                self.logger.debug(f"{symbol}: Signal lost stability. Resetting counters.")
-            self.signal_counters[symbol]['entry'] = 0
-            self.signal_counters[symbol]['exit'] = 0
+            if counters['entry'] > 0 or counters['exit'] > 0:
+                self.logger.debug("%s: Signal lost stability. Resetting counters.", symbol)
+            counters['entry'] = 0
+            counters['exit'] = 0
 
         # === TRIGGER ACTION ===
         
         # Check Entry Trigger
-        if self.signal_counters[symbol]['entry'] >= min_entry_ticks and not self.in_position[symbol]:
+        if counters['entry'] >= min_entry_ticks and not in_position:
             self.in_position[symbol] = True
             ex_a, ex_b = self.active_pairs[symbol]
             self.event_bus.emit_signal_triggered(symbol, 'ENTRY', z_score, ex_a, ex_b)
             
             self.logger.info(
-                f"🔔 ENTRY SIGNAL: {symbol} | Z-Score={z_score:.2f} | "
-                f"Net Spread={net_spread_pct:.3f}% | "
-                f"Confirmed for {self.signal_counters[symbol]['entry']} ticks"
+                "[ENTRY] %s | Z-Score=%.2f | Net Spread=%.3f%% | Confirmed for %d ticks",
+                symbol, z_score, net_spread_pct, counters['entry']
             )
             # Reset counter after action to prevent double firing? 
             # Actually, keep it high or reset? 
             # Resetting is safer to prevent immediate re-trigger if logic loops.
-            self.signal_counters[symbol]['entry'] = 0
+            counters['entry'] = 0
 
         # Check Exit Trigger
-        elif self.signal_counters[symbol]['exit'] >= min_exit_ticks and self.in_position[symbol]:
+        elif counters['exit'] >= min_exit_ticks and in_position:
             self.in_position[symbol] = False
             ex_a, ex_b = self.active_pairs[symbol]
             self.event_bus.emit_signal_triggered(symbol, 'EXIT', z_score, ex_a, ex_b)
             
             self.logger.info(
-                f"🔔 EXIT SIGNAL: {symbol} | Z-Score={z_score:.2f} | "
-                f"Confirmed for {self.signal_counters[symbol]['exit']} ticks. "
-                f"[Audit: NetSpread={net_spread_pct:.3f}%]"
+                "[EXIT] %s | Z-Score=%.2f | Confirmed for %d ticks. [Audit: NetSpread=%.3f%%]",
+                symbol, z_score, counters['exit'], net_spread_pct
             )
-            self.signal_counters[symbol]['exit'] = 0
+            counters['exit'] = 0
 
     
+    async def _check_signals_batch(self, symbol: str, z_scores: np.ndarray,
+                                   net_spread_pcts: np.ndarray) -> None:
+        """
+        Run _check_signals over a sequence of ticks with NumPy instead of one call per tick.
+        
+        Same persistence rules, counters and triggers as calling _check_signals for
+        each tick in order (e.g. for replaying/backfilling recorded ticks).
+        
+        Args:
+            symbol: Trading pair symbol
+            z_scores: Z-Score per tick (oldest first)
+            net_spread_pcts: Net spread percentage per tick
+        """
+        abs_z = np.abs(np.asarray(z_scores, dtype=np.float64))
+        net_spread_pcts = np.asarray(net_spread_pcts, dtype=np.float64)
+        n = abs_z.shape[0]
+        if n == 0:
+            return
+        
+        counters = self.signal_counters.get(symbol)
+        if counters is None:
+            counters = self.signal_counters[symbol] = {'entry': 0, 'exit': 0}
+        in_position = self.in_position.setdefault(symbol, False)
+        
+        # Tick conditions for each phase. Flat: only the entry run counts (any other
+        # tick resets both counters). In position: only the exit run counts.
+        entry_ok = (abs_z > self._z_entry) & (net_spread_pcts > self._min_spread_pct)
+        exit_ok = abs_z < self._z_exit
+        idx = np.arange(n)
+        
+        start = 0
+        while start < n:
+            if in_position:
+                mask, key, other, needed = exit_ok[start:], 'exit', 'entry', self._min_exit_ticks
+            else:
+                mask, key, other, needed = entry_ok[start:], 'entry', 'exit', self._min_entry_ticks
+            
+            # Consecutive-run length ending at each tick; the run touching the start
+            # continues the carried-over counter
+            pos = idx[:mask.shape[0]]
+            last_break = np.maximum.accumulate(np.where(mask, -1, pos))
+            runs = pos - last_break
+            runs[last_break < 0] += counters[key]
+            
+            hits = np.flatnonzero(mask & (runs >= needed))
+            if hits.shape[0] == 0:
+                counters[key] = int(runs[-1]) if mask[-1] else 0
+                counters[other] = 0
+                return
+            
+            hit = start + int(hits[0])
+            z_score = float(z_scores[hit])
+            ex_a, ex_b = self.active_pairs[symbol]
+            if in_position:
+                self.in_position[symbol] = False
+                self.event_bus.emit_signal_triggered(symbol, 'EXIT', z_score, ex_a, ex_b)
+                self.logger.info(
+                    "[EXIT] %s | Z-Score=%.2f | Confirmed for %d ticks. [Audit: NetSpread=%.3f%%]",
+                    symbol, z_score, int(runs[hit - start]), net_spread_pcts[hit]
+                )
+            else:
+                self.in_position[symbol] = True
+                self.event_bus.emit_signal_triggered(symbol, 'ENTRY', z_score, ex_a, ex_b)
+                self.logger.info(
+                    "[ENTRY] %s | Z-Score=%.2f | Net Spread=%.3f%% | Confirmed for %d ticks",
+                    symbol, z_score, net_spread_pcts[hit], int(runs[hit - start])
+                )
+            counters[key] = 0
+            counters[other] = 0
+            in_position = not in_position
+            start = hit + 1
+    
     async def start(self, symbols: List[str], pair: tuple = ('bingx', 'bybit')) -> None:
         """
         Start live monitoring for given symbols with specified exchange pair.
@@ -493,8 +786,11 @@ class LiveMonitor:
             symbols: List of trading pair symbols to monitor
             pair: Tuple of exchange IDs (ex_a, ex_b)
         """
-        # Store active pair for these symbols
+        # Store active pair for these symbols; a symbol that is new or moves to a
+        # different pair starts from clean state, not the previous pair's stats
         for symbol in symbols:
+            if self.active_pairs.get(symbol) != pair:
+                self._reset_symbol_state(symbol)
             self.active_pairs[symbol] = pair
 
         # If already running, just add new symbols dynamically
@@ -512,6 +808,9 @@ class LiveMonitor:
         self.running = True
         self.logger.info(f"Starting LiveMonitor for {len(symbols)} symbols on {pair}")
         
+        # Compile numeric kernels before the first tick arrives
+        warm_up_kernels()
+        
         # Pre-load historical data for all symbols
         for symbol in symbols:
             await self._preload_history(symbol, ex_a=pair[0], ex_b=pair[1])
@@ -524,6 +823,18 @@ class LiveMonitor:
         
         self.logger.info("LiveMonitor started with hybrid Z-Score calculation")
     
+    def _reset_symbol_state(self, symbol: str) -> None:
+        """
+        Forget the evaluation state of a symbol (last snapshot, ticks, position).
+        
+        Args:
+            symbol: Trading pair symbol
+        """
+        self.latest_updates.pop(symbol, None)
+        self._last_eval_ticks.pop(symbol, None)
+        self.in_position.pop(symbol, None)
+        self.signal_counters.pop(symbol, None)
+    
     async def stop(self) -> None:
         """
         Stop live monitoring and cleanup resources.
@@ -534,6 +845,12 @@ class LiveMonitor:
         # Stop WebSocket manager
         await self.ws_manager.stop()
         
+        # Drop any pending batched spread updates
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_updates.clear()
+        
         # Cancel monitor task
         if self.monitor_task and not self.monitor_task.done():
             self.monitor_task.cancel()
@@ -548,14 +865,37 @@ class LiveMonitor:
         
         # Clear buffers
         self.spread_history.clear()
-        self.price_cache = {ex: {} for ex in self.supported_exchanges}
+        self._hist_n.clear()
+        self._hist_head.clear()
+        self._hist_stats.clear()
+        self.price_cache.clear()
         self.last_history_update.clear()
         self.active_pairs.clear()
         self.in_position.clear()
         self.signal_counters.clear()
+        self._last_eval_ticks.clear()
+        self._stats_updated.clear()
+        self.latest_updates.clear()
         
         self.logger.info("LiveMonitor stopped")
     
+    def stats_event(self, symbol: str) -> asyncio.Event:
+        """
+        Get the event that is set each time new stats are computed for a symbol.
+        
+        Waiters should clear() it after waking and then read latest_updates[symbol].
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            asyncio.Event for the symbol (created on first request)
+        """
+        event = self._stats_updated.get(symbol)
+        if event is None:
+            event = self._stats_updated[symbol] = asyncio.Event()
+        return event
+    
     def get_current_stats(self, symbol: str) -> Optional[Dict]:
         """
         Get current statistics for a symbol.
@@ -566,10 +906,7 @@ class LiveMonitor:
         Returns:
             Dictionary with current stats or None
         """
-        if symbol not in self.spread_history:
-            return None
-        
-        if len(self.spread_history[symbol]) < 10:
+        if self._hist_n.get(symbol, 0) < 10:
             return None
         
         # Get active pair
@@ -578,37 +915,34 @@ class LiveMonitor:
             return None
         ex_a, ex_b = pair
 
-        # Get current prices
-        price_a = self.price_cache[ex_a].get(symbol)
-        price_b = self.price_cache[ex_b].get(symbol)
+        # Get current quotes
+        quote_a = self.price_cache.get((ex_a, symbol))
+        quote_b = self.price_cache.get((ex_b, symbol))
         
-        if not price_a or not price_b:
+        if quote_a is None or quote_b is None:
             return None
         
+        bid_a, ask_a, last_a = quote_a
+        bid_b, ask_b, last_b = quote_b
+        
         # Calculate current spread
-        spread_a_to_b = price_a['ask'] - price_b['bid']
-        spread_b_to_a = price_b['ask'] - price_a['bid']
-        gross_spread = min(abs(spread_a_to_b), abs(spread_b_to_a))
-        if spread_a_to_b < 0:
-            gross_spread = -gross_spread
+        gross_spread = _pick_spread(ask_a - bid_b, ask_b - bid_a)
         
         # Calculate mid-price and net spread
-        mid_price = (price_a['last'] + price_b['last']) / 2.0
-        net_spread_val, net_spread_pct, fee_cost = calculate_net_spread(
-            gross_spread=abs(gross_spread),
-            price=mid_price,
-            taker_fee_a=self.fees[ex_a]['taker'],
-            taker_fee_b=self.fees[ex_b]['taker']
-        )
+        mid_price = (last_a + last_b) / 2.0
+        fee_rate, _ = self._get_pair_fees(pair)
+        if mid_price > 0:
+            fee_cost = mid_price * fee_rate
+            net_spread_val = abs(gross_spread) - fee_cost
+            net_spread_pct = (net_spread_val / mid_price) * 100
+        else:
+            fee_cost = net_spread_val = net_spread_pct = 0.0
         if gross_spread < 0:
             net_spread_val = -net_spread_val
             net_spread_pct = -net_spread_pct
         
-        # Calculate Z-Score from historical baseline (GROSS spreads)
-        spreads = list(self.spread_history[symbol])
-        mean = sum(spreads) / len(spreads)
-        variance = sum((x - mean) ** 2 for x in spreads) / len(spreads)
-        std_dev = variance ** 0.5
+        # Calculate Z-Score from the cached historical baseline (GROSS spreads)
+        mean, std_dev = self._hist_stats[symbol]
         
         if std_dev == 0:
             z_score = 0.0
@@ -624,7 +958,7 @@ class LiveMonitor:
             'fee_cost': fee_cost,
             'z_score': z_score,
             'in_position': self.in_position.get(symbol, False),
-            'history_length': len(self.spread_history[symbol]),
+            'history_length': self._hist_n[symbol],
             'baseline_mean': mean,
             'baseline_std': std_dev,
             'mid_price': mid_price,
@@ -700,8 +1034,8 @@ async def main():
                         f"{position_indicator}"
                     )
                 else:
-                    history_len = len(monitor.spread_history.get(symbol, deque()))
-                    print(f"{symbol:12} | Building baseline... ({history_len}/60 samples)")
+                    history_len = monitor._hist_n.get(symbol, 0)
+                    print(f"{symbol:12} | Building baseline... ({history_len}/{monitor.history_length} samples)")
             
             print(f"{'-'*70}")
     
@@ -715,4 +1049,6 @@ async def main():
 
 
 if __name__ == '__main__':
+    from utils.event_loop import install_uvloop
+    get_logger(__name__).info(f"Event loop policy: {install_uvloop()}")
     asyncio.run(main())
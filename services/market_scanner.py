@@ -8,15 +8,23 @@ Generates whitelist of validated pairs for live trading.
 import sys
 import json
 import time
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import warnings
 
-import ccxt
+import ccxt.async_support as ccxt
 import pandas as pd
 import yaml
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -38,6 +46,9 @@ class MarketScanner:
     - Whitelist generation for profitable pairs
     """
     
+    # Upper bound on cached REST responses (oldest evicted first)
+    CACHE_MAX_ENTRIES = 2048
+    
     def __init__(self, config_path: str = 'config/config.yaml'):
         """
         Initialize the Market Scanner.
@@ -50,6 +61,26 @@ class MarketScanner:
         self.exchanges = self._setup_exchanges()
         self.validator = HistoricalValidator(config_path)
         
+        # Parallel scan settings; CCXT's enableRateLimit paces each client,
+        # the per-exchange semaphores cap in-flight requests on top of that
+        scanner_config = self.config.get('scanner', {})
+        self.max_workers = scanner_config.get('max_workers', 8)
+        per_exchange = scanner_config.get('per_exchange_concurrency', 3)
+        self._pair_slots = asyncio.Semaphore(self.max_workers)
+        self._exchange_slots: Dict[str, asyncio.Semaphore] = {
+            ex_id: asyncio.Semaphore(per_exchange) for ex_id in self.exchanges
+        }
+        
+        # Minimum pause between starting two pair analyses (the scan used to sleep
+        # this long after each pair); spreads the historical OHLCV requests out
+        self.pair_interval = scanner_config.get('pair_interval', 0.5)
+        self._pair_pace_lock = asyncio.Lock()
+        self._next_pair_at = 0.0
+        
+        # Short-lived REST response cache: (kind, exchange_id, symbol) -> (expires_at, response)
+        self.cache_ttl = scanner_config.get('cache_ttl', 30)
+        self._response_cache: OrderedDict = OrderedDict()
+        
         self.logger.info("MarketScanner initialized successfully")
     
     def _load_config(self, config_path: str) -> dict:
@@ -136,7 +167,7 @@ class MarketScanner:
             self.logger.error(f"Error setting up exchanges: {e}")
             raise
     
-    def get_common_symbols(self) -> List[str]:
+    async def get_common_symbols(self) -> List[str]:
         """
         Find common trading symbols across both exchanges.
         
@@ -152,8 +183,10 @@ class MarketScanner:
             bybit = self.exchanges['bybit']
             
             # Load markets
-            bingx_markets = bingx.load_markets()
-            bybit_markets = bybit.load_markets()
+            bingx_markets, bybit_markets = await asyncio.gather(
+                bingx.load_markets(),
+                bybit.load_markets()
+            )
             
             # Get symbol sets
             bingx_symbols = set(bingx_markets.keys())
@@ -166,30 +199,19 @@ class MarketScanner:
             
             # Apply filters
             exclude_patterns = self.config['scanner'].get('exclude_patterns', [])
-            filtered_symbols = []
-            
-            for symbol in common_symbols:
-                # Check exclude patterns
-                excluded = False
-                for pattern in exclude_patterns:
-                    if pattern.endswith('*'):
-                        # Prefix match
-                        if symbol.startswith(pattern[:-1]):
-                            excluded = True
-                            break
-                    elif pattern.startswith('*'):
-                        # Suffix match
-                        if symbol.endswith(pattern[1:]):
-                            excluded = True
-                            break
-                    else:
-                        # Exact match
-                        if symbol == pattern:
-                            excluded = True
-                            break
-                
-                if not excluded:
-                    filtered_symbols.append(symbol)
+            
+            # Partition patterns once: 'X*' prefix, '*X' suffix, otherwise exact.
+            # str.startswith/endswith take tuples, so each check is a single C call.
+            prefixes = tuple(p[:-1] for p in exclude_patterns if p.endswith('*'))
+            suffixes = tuple(p[1:] for p in exclude_patterns if p.startswith('*') and not p.endswith('*'))
+            exact = {p for p in exclude_patterns if not p.startswith('*') and not p.endswith('*')}
+            
+            filtered_symbols = [
+                symbol for symbol in common_symbols
+                if symbol not in exact
+                and not symbol.startswith(prefixes)
+                and not symbol.endswith(suffixes)
+            ]
             
             self.logger.info(
                 f"Filtered to {len(filtered_symbols)} symbols "
@@ -202,7 +224,65 @@ class MarketScanner:
             self.logger.error(f"Error fetching common symbols: {e}")
             return []
     
-    def _get_depth_usdt(self, exchange: ccxt.Exchange, symbol: str) -> float:
+    async def _wait_pair_turn(self) -> None:
+        """Wait until pair_interval seconds have passed since the previous pair started."""
+        if self.pair_interval <= 0:
+            return
+        async with self._pair_pace_lock:
+            delay = self._next_pair_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_pair_at = time.monotonic() + self.pair_interval
+    
+    async def _fetch_cached(self, kind: str, ex_id: str, symbol: str) -> dict:
+        """
+        Fetch a ticker or order book, reusing a response from the last cache_ttl seconds.
+        
+        A cache_ttl of 0 (or less) disables the cache.
+        
+        Args:
+            kind: 'ticker' or 'order_book'
+            ex_id: Exchange ID
+            symbol: Trading pair symbol
+            
+        Returns:
+            CCXT response dictionary (shared, do not mutate)
+        """
+        key: Tuple[str, str, str] = (kind, ex_id, symbol)
+        use_cache = self.cache_ttl > 0
+        if use_cache:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                expires_at, response = cached
+                if time.monotonic() < expires_at:
+                    self._response_cache.move_to_end(key)
+                    return response
+                del self._response_cache[key]
+        
+        exchange = self.exchanges[ex_id]
+        async with self._exchange_slots[ex_id]:
+            if kind == 'ticker':
+                response = await exchange.fetch_ticker(symbol)
+            else:
+                response = await exchange.fetch_order_book(symbol, limit=20)
+        
+        if use_cache:
+            self._response_cache[key] = (time.monotonic() + self.cache_ttl, response)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > self.CACHE_MAX_ENTRIES:
+                self._response_cache.popitem(last=False)
+        return response
+    
+    def clear_cache(self) -> None:
+        """Drop all cached tickers and order books."""
+        self._response_cache.clear()
+    
+    async def close(self) -> None:
+        """Close exchange connections."""
+        for exchange in self.exchanges.values():
+            await exchange.close()
+    
+    async def _get_depth_usdt(self, exchange: ccxt.Exchange, symbol: str) -> float:
         """
         Calculate order book depth in USDT within 2% of mid price.
         
@@ -214,7 +294,7 @@ class MarketScanner:
             Total depth in USDT
         """
         try:
-            orderbook = exchange.fetch_order_book(symbol, limit=20)
+            orderbook = await self._fetch_cached('order_book', exchange.id, symbol)
             
             if not orderbook['bids'] or not orderbook['asks']:
                 return 0.0
@@ -245,7 +325,7 @@ class MarketScanner:
             self.logger.debug(f"Error fetching depth for {symbol}: {e}")
             return 0.0
     
-    def analyze_pair(self, symbol: str) -> Optional[Dict]:
+    async def analyze_pair(self, symbol: str) -> Optional[Dict]:
         """
         Perform comprehensive analysis on a single trading pair.
         
@@ -260,8 +340,10 @@ class MarketScanner:
             bybit = self.exchanges['bybit']
             
             # 1. Volume Check
-            ticker_a = bingx.fetch_ticker(symbol)
-            ticker_b = bybit.fetch_ticker(symbol)
+            ticker_a, ticker_b = await asyncio.gather(
+                self._fetch_cached('ticker', 'bingx', symbol),
+                self._fetch_cached('ticker', 'bybit', symbol)
+            )
             
             vol_a = ticker_a.get('quoteVolume') or (
                 ticker_a.get('baseVolume', 0) * ticker_a.get('last', 0)
@@ -277,8 +359,10 @@ class MarketScanner:
                 return None
             
             # 2. Depth Check
-            depth_a = self._get_depth_usdt(bingx, symbol)
-            depth_b = self._get_depth_usdt(bybit, symbol)
+            depth_a, depth_b = await asyncio.gather(
+                self._get_depth_usdt(bingx, symbol),
+                self._get_depth_usdt(bybit, symbol)
+            )
             min_depth = min(depth_a, depth_b)
             
             min_depth_required = self.config['validation']['min_depth_usdt']
@@ -291,11 +375,9 @@ class MarketScanner:
             timeframe = self.config['validation'].get('timeframe', '1h')
             limit = self.config['validation'].get('candles_limit', 500)
             
-            analysis = self.validator.analyze(
-                symbol=symbol,
-                timeframe=timeframe,
-                limit=limit
-            )
+            # Runs on this loop: the validator moves its blocking CCXT calls to
+            # threads, one at a time per exchange client
+            analysis = await self.validator.analyze(symbol=symbol, timeframe=timeframe, limit=limit)
             
             if 'error' in analysis:
                 self.logger.debug(f"{symbol}: Analysis failed - {analysis['error']}")
@@ -326,7 +408,7 @@ class MarketScanner:
             self.logger.debug(f"Error analyzing {symbol}: {e}")
             return None
     
-    def scan(
+    async def scan(
         self,
         save_to_whitelist: bool = True,
         csv_path: str = 'arbitrage_candidates.csv'
@@ -344,7 +426,7 @@ class MarketScanner:
         self.logger.info("Starting market scan...")
         
         # Get symbols to scan
-        symbols = self.get_common_symbols()
+        symbols = await self.get_common_symbols()
         
         if not symbols:
             self.logger.warning("No symbols found to scan")
@@ -357,18 +439,29 @@ class MarketScanner:
         print(f"Scanning {total} pairs for arbitrage opportunities")
         print(f"{'='*60}\n")
         
-        # Scan each symbol
-        for i, symbol in enumerate(symbols):
-            print(f"[{i+1}/{total}] Analyzing {symbol}...", end='\r')
-            
-            metrics = self.analyze_pair(symbol)
-            
-            if metrics:
+        # Scan symbols concurrently (network-bound), at most max_workers at a time
+        done = 0
+        
+        async def analyze_with_progress(symbol: str) -> Optional[Dict]:
+            nonlocal done
+            async with self._pair_slots:
+                await self._wait_pair_turn()
+                metrics = await self.analyze_pair(symbol)
+            done += 1
+            print(f"[{done}/{total}] Analyzed {symbol}...", end='\r')
+            return metrics
+        
+        all_metrics = await asyncio.gather(
+            *(analyze_with_progress(symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+        
+        for symbol, metrics in zip(symbols, all_metrics):
+            if isinstance(metrics, Exception):
+                self.logger.debug(f"Error analyzing {symbol}: {metrics}")
+            elif metrics:
                 results.append(metrics)
                 self.logger.debug(f"{symbol}: Analysis complete")
-            
-            # Rate limiting
-            time.sleep(0.5)
         
         print(f"\n\nScan complete. Found {len(results)} valid pairs.\n")
         
@@ -392,9 +485,9 @@ class MarketScanner:
         # Sort by max spread descending
         df_sorted = df_filtered.sort_values(by='max_spread_pct', ascending=False)
         
-        # Save to CSV
+        # Save to CSV in chunks (compression is inferred from the suffix, e.g. .csv.gz)
         csv_file = Path(csv_path)
-        df_sorted.to_csv(csv_file, index=False)
+        df_sorted.to_csv(csv_file, index=False, chunksize=1024)
         self.logger.info(f"Results saved to {csv_file}")
         
         print(f"Saved {len(df_sorted)} profitable pairs to {csv_path}")
@@ -450,8 +543,13 @@ class MarketScanner:
             }
             
             # Save to file
-            with open(whitelist_path, 'w') as f:
-                json.dump(whitelist_data, f, indent=2)
+            if HAS_ORJSON:
+                whitelist_path.write_bytes(
+                    orjson.dumps(whitelist_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+                )
+            else:
+                with open(whitelist_path, 'w') as f:
+                    json.dump(whitelist_data, f, indent=2)
             
             self.logger.info(f"Whitelist saved to {whitelist_path}")
             print(f"Whitelist updated: {whitelist_path}")
@@ -485,14 +583,20 @@ def main():
     
     args = parser.parse_args()
     
-    # Create scanner
-    scanner = MarketScanner(config_path=args.config)
+    async def run_scan() -> List[Dict]:
+        # Create scanner
+        scanner = MarketScanner(config_path=args.config)
+        
+        # Run scan
+        try:
+            return await scanner.scan(
+                save_to_whitelist=not args.no_whitelist,
+                csv_path=args.csv
+            )
+        finally:
+            await scanner.close()
     
-    # Run scan
-    results = scanner.scan(
-        save_to_whitelist=not args.no_whitelist,
-        csv_path=args.csv
-    )
+    results = asyncio.run(run_scan())
     
     print(f"\n{'='*60}")
     print(f"Scan complete! Found {len(results)} profitable opportunities.")
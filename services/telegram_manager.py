@@ -7,10 +7,13 @@ Replies to signals with ✅ when confirmed.
 """
 
 import asyncio
+import logging
+import multiprocessing
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from telethon import TelegramClient, events
 from telethon.tl.types import Message
@@ -21,6 +24,7 @@ from core.event_bus import EventBus
 from utils.logger import get_logger
 from utils.symbol_resolver import SymbolResolver
 from utils.config import get_config
+from utils.metrics import warm_up as warm_up_metrics
 
 from telethon.sessions import StringSession
 
@@ -29,18 +33,29 @@ class TelegramSignalManager:
     Manages Telegram connectivity and orchestrates signal validation.
     """
     
-    def __init__(self, config_path: str = 'config/config.yaml'):
+    def __init__(self, config_path: str = 'config/config.yaml',
+                 validator: Optional[HistoricalValidator] = None):
+        """
+        Initialize the Telegram signal manager.
+        
+        Args:
+            config_path: Path to configuration file
+            validator: Pre-built historical validator to use instead of creating one
+                (e.g. a stub in tests)
+        """
         self.logger = get_logger(__name__)
         self.config_path = config_path
         
         # Load config
-        full_config = get_config(config_path)
-        self.tg_config = full_config.get('telegram', {})
-        
-        self.validator = HistoricalValidator(config_path)
-        self.monitor = LiveMonitor(config_path)
+        self.full_config = get_config(config_path)
+        self.tg_config = self.full_config.get('telegram', {})
+        
+        # Built on first use (see the properties below): the validator loads exchange
+        # markets over the network, which a disabled integration should not pay for
+        self._validator: Optional[HistoricalValidator] = validator
+        self._monitor: Optional[LiveMonitor] = None
+        self._resolver: Optional[SymbolResolver] = None
         self.event_bus = EventBus.instance()
-        self.resolver = SymbolResolver(full_config)
         
         self.enabled = self.tg_config.get('enabled', False)
         self.api_id = self.tg_config.get('api_id')
@@ -54,6 +69,26 @@ class TelegramSignalManager:
         self.adf_candles = self.tg_config.get('adf_lookback_candles', 1000)
         self.adf_timeframe = self.tg_config.get('adf_timeframe', '15m')
         
+        # Recent validation results: (symbol, ex_a, ex_b) -> (expires_at, results).
+        # A symbol signalled again within the TTL reuses the last ADF check instead of
+        # refetching the candles (0 disables the cache)
+        self.adf_cache_ttl = float(self.tg_config.get('adf_cache_ttl', 900))
+        self._adf_cache: Dict[Tuple[str, str, str], Tuple[float, dict]] = {}
+        
+        # ADF/Z-Score runs in worker processes so concurrent validations do not
+        # block message handling (0 = run inline on the event loop). The pool is
+        # created in start(), so a manager that never starts spawns nothing
+        self.adf_workers = int(self.tg_config.get('adf_workers', 2))
+        self.adf_pool: Optional[ProcessPoolExecutor] = None
+        self._warmup_task: Optional[asyncio.Task] = None
+        
+        # Signal filters (read once; used per symbol / per confirmation check)
+        self.symbol_mapping = self.tg_config.get('symbol_mapping', {})
+        self.min_signal_spread_pct = float(self.tg_config.get('min_signal_spread_pct', 0.0))
+        self.min_spread_pct = float(self.tg_config.get('min_spread_pct', 0.005))
+        self.z_threshold = float(self.tg_config.get('z_score_entry', 2.5))
+        self.require_direction_match = bool(self.tg_config.get('require_direction_match', False))
+        
         self.client: Optional[TelegramClient] = None
         self.active_signals: Dict[str, asyncio.Task] = {} # symbol -> monitoring task
         
@@ -84,12 +119,33 @@ class TelegramSignalManager:
         # Regular fallback for simple pairs (if needed)
         self.pair_regex = re.compile(r'\b([A-Z0-9]{2,10})/(USDT|USDC|BUSD)\b', re.IGNORECASE)
         
+        # 4. Markdown/URL stripping (ORDER MATTERS!)
+        # Markdown links -> plain text first: [bingx](url) -> bingx
+        self.md_link_regex = re.compile(r'\[([^\]]+)\]\([^)]*\)')
+        # Bold/italic markers and backticks: dropping every marker char also unwraps **bold**
+        self.markup_chars = str.maketrans('', '', '_*~`')
+        # Remaining URLs last, once markers inside them are gone
+        self.url_regex = re.compile(r'HTTPS?://\S+', re.IGNORECASE)
+        
         # Blacklist for common false positives
-        self.symbol_blacklist = {
+        self.symbol_blacklist = frozenset({
             'HTTPS', 'HTTP', 'TRADE', 'INFO', 'HELP', 'LIMIT', 'MARKET', 'ТЕК', 'TEXT',
             'CHART', 'FOLLOW', 'GRAPH', 'ГРАФИК', 'ГРАФ', 'СЛЕДИТЬ', 'SCORE', 'Z-SCORE',
             'MONITORING', 'INITIAL', 'TARGET'
-        }
+        })
+        
+        # Both header forms in one scan, with blacklisted tokens rejected inside the regex:
+        # group 1 = Form 1, group 2 = Form 2. Each lookahead spells out the rest of its
+        # form, so it only rejects a token that is blacklisted as a whole. The two forms
+        # can't overlap (Form 1 ends in ':', which Form 2 can't contain), so finditer sees
+        # the non-blacklisted matches of the two separate patterns, in text order
+        blacklisted = '|'.join(map(re.escape, sorted(self.symbol_blacklist, key=len, reverse=True)))
+        tek_tail = r'USDT\s*-\s*(?:ТЕК|ТEXT)'
+        self.header_regex = re.compile(
+            rf'\b(?!(?:{blacklisted}):)([A-Z0-9]{{2,10}}):'
+            rf'|\b(?!(?:{blacklisted}){tek_tail})([A-Z0-9]{{2,10}}){tek_tail}',
+            re.IGNORECASE
+        )
         
         # Exchange name mapping: signal name -> internal exchange ID
         # Maps variations of exchange names in signals to our internal identifiers
@@ -113,11 +169,60 @@ class TelegramSignalManager:
             'mexc': 'mexc',
         }
         
+        # Key every name the way matches are normalized, so the two always agree
+        self.exchange_name_map = {
+            self._exchange_key(name): internal for name, internal in self.exchange_name_map.items()
+        }
+        
         # All supported exchanges for strict matching
         self.supported_exchanges = set(self.exchange_name_map.values())
         
+        # Combined regex for all exchange names (longest first so 'gate.io' wins over 'gate')
+        ex_names = sorted(self.exchange_name_map.keys(), key=len, reverse=True)
+        self.exchange_regex = re.compile(r'\b(' + '|'.join(map(re.escape, ex_names)) + r')\b', re.IGNORECASE)
+        
         self.logger.info(f"TelegramSignalManager initialized with {len(self.supported_exchanges)} supported exchanges")
 
+    @staticmethod
+    def _exchange_key(name: str) -> str:
+        """
+        Normalize an exchange name as matched by the IGNORECASE exchange regex.
+        
+        Besides ASCII casings, the regex accepts the Unicode variants Python's re
+        treats as equal to ASCII letters ('ı'/'İ' for 'i', 'ſ' for 's', the Kelvin
+        sign for 'k'); upper() then lower() maps them back to ASCII, except 'İ',
+        which lowers to 'i' plus a combining dot that is dropped here.
+        
+        Args:
+            name: Exchange name as written in the message
+            
+        Returns:
+            Lowercase ASCII key into exchange_name_map
+        """
+        return name.upper().lower().replace('\u0307', '')
+
+    @property
+    def validator(self) -> HistoricalValidator:
+        """Historical validator, created on first access and wired to the ADF pool."""
+        if self._validator is None:
+            self._validator = HistoricalValidator(self.config_path)
+            self._validator.executor = self.adf_pool
+        return self._validator
+
+    @property
+    def monitor(self) -> LiveMonitor:
+        """Live spread monitor, created on first access."""
+        if self._monitor is None:
+            self._monitor = LiveMonitor(self.config_path)
+        return self._monitor
+
+    @property
+    def resolver(self) -> SymbolResolver:
+        """Symbol resolver, created on first access."""
+        if self._resolver is None:
+            self._resolver = SymbolResolver(self.full_config)
+        return self._resolver
+
     async def start(self):
         """Start the Telegram client and listeners."""
         if not self.enabled:
@@ -128,6 +233,12 @@ class TelegramSignalManager:
             self.logger.error("Telegram API credentials missing. Please check config/config.yaml or environment variables")
             return
 
+        self._start_adf_pool()
+        
+        # Build the validator (blocking market loads) off the loop before any
+        # message handler can touch it
+        await asyncio.to_thread(lambda: self.validator)
+
         if self.session_string:
             self.logger.info("Connecting to Telegram using StringSession...")
             self.client = TelegramClient(StringSession(self.session_string), self.api_id, self.api_hash)
@@ -144,81 +255,142 @@ class TelegramSignalManager:
         await self.client.start()
         self.logger.info("✅ Telegram connected and listening for signals")
         
+        # Compile the ADF kernel in the background so the first signal doesn't wait for it
+        self._warmup_task = asyncio.create_task(self._warm_up_adf())
+        
         # Keep it running
         await self.client.run_until_disconnected()
 
+    def _start_adf_pool(self) -> None:
+        """
+        Create the ADF worker pool (if enabled) and hand it to the validator.
+        
+        Workers are spawned rather than forked: by now this process runs the
+        logging listener (and later Telethon) threads, and a forked child would
+        inherit their locks and a log queue nobody drains.
+        """
+        if self.adf_pool is not None or self.adf_workers <= 0:
+            return
+        self.adf_pool = ProcessPoolExecutor(
+            max_workers=self.adf_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=warm_up_metrics
+        )
+        if self._validator is not None:
+            self._validator.executor = self.adf_pool
+
+    async def _warm_up_adf(self):
+        """Compile the ADF kernel here and start the ADF worker processes ahead of the first signal."""
+        try:
+            # Compiles in a thread and fills Numba's on-disk cache, so workers only load it
+            await asyncio.to_thread(self.validator.warmup)
+            if self.adf_pool is not None:
+                # Workers start lazily on submit; one job per worker starts them all now,
+                # each running the warm-up initializer
+                loop = asyncio.get_running_loop()
+                await asyncio.gather(*(
+                    loop.run_in_executor(self.adf_pool, warm_up_metrics)
+                    for _ in range(self.adf_workers)
+                ))
+            self.logger.info("ADF kernel warmed up")
+        except Exception as e:
+            self.logger.warning(f"ADF warm-up failed: {e}")
+
     async def stop(self):
         """Stop the client and all active monitoring tasks."""
         if self.client:
             await self.client.disconnect()
         
-        for task in self.active_signals.values():
+        tasks = list(self.active_signals.values())
+        for task in tasks:
             task.cancel()
+        # Let cancelled validations unwind before the monitor and pool go away
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
         
-        await self.monitor.stop()
+        if self._monitor is not None:
+            await self._monitor.stop()
+        
+        if self.adf_pool is not None:
+            self.adf_pool.shutdown(wait=False, cancel_futures=True)
+            self.adf_pool = None
+            if self._validator is not None:
+                self._validator.executor = None
         self.logger.info("TelegramSignalManager stopped")
 
     async def _process_message(self, message: Message):
         """Parse message for symbols and start validation if found."""
-        if not message.text:
+        raw = message.text
+        if not raw:
+            return
+        
+        # Cheap pre-check: every symbol form needs one of these characters
+        # ("GAIB:" header, "PTBUSDT - ТЕК" header, "BTC/USDT" pair)
+        if ':' not in raw and '/' not in raw and '-' not in raw:
             return
             
-        text = message.text.upper()
+        # All parser regexes are case-insensitive, so work on the original text and
+        # upper-case only the short matched tokens
         
-        # Pre-process: Strip Telegram Markdown & URLs (ORDER MATTERS!)
-        # Step 1: Convert Markdown links to plain text FIRST: [bingx](url) -> bingx
-        text = re.sub(r'\[([^\]]+)\]\([^)]*\)', r'\1', text)
-        # Step 2: Remove bold/italic markers (**, *, _, ~)
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # **bold** -> bold
-        text = re.sub(r'[_*~]', '', text)  # Remove remaining markers
-        # Step 3: Remove backticks (code formatting)
-        text = re.sub(r'`', '', text)
-        # Step 4: Clean up any remaining URLs
-        text = re.sub(r'HTTPS?://\S+', '', text)
+        # Pre-process: Strip Telegram Markdown & URLs
+        text = self.md_link_regex.sub(r'\1', raw).translate(self.markup_chars)
+        text = self.url_regex.sub('', text)
         
-        self.logger.debug(f"📩 Processing message from {message.chat_id}: {text[:100]}...")
-        self.logger.info(f"🔍 RAW MESSAGE from chat {message.chat_id}: {message.text[:200]}")  # NEW: Full visibility
-        self.logger.info(f"🧹 CLEANED TEXT (after preprocessing): {text[:200]}")  # NEW: Show processed text
+        # Per-message dumps are DEBUG only; guard so the slices are skipped too
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("🔍 RAW MESSAGE from chat %s: %s", message.chat_id, raw[:200])
+            self.logger.debug("🧹 CLEANED TEXT (after preprocessing): %s", text[:200])
         
-        symbols_found = set()
+        # (base, quote) pairs, so the loop below does not have to split 'BASE/QUOTE' again
+        symbols_found: Set[Tuple[str, str]] = set()
         
         # --- Parsing Strategy ---
         
         # 1. Check for Structured Headers
-        # Use findall to find all candidates and pick the first one not in blacklist
-        gaib_matches = self.header_gaib_regex.findall(text)
-        tek_matches = self.header_tek_regex.findall(text)
-        
+        # Fast path: most signals open with "GAIB: ...". A leading ASCII token followed by
+        # ':' is exactly the first Form 1 match the regex would return
         base_token = None
-        # Check Form 1
-        for token_candidate in gaib_matches:
-            token_candidate = token_candidate.upper()
-            if token_candidate not in self.symbol_blacklist:
-                base_token = token_candidate
-                break
-        
-        # Check Form 2 if Form 1 didn't find anything
+        head, sep, _ = text.lstrip().partition(':')
+        if sep and 2 <= len(head) <= 10 and head.isascii() and head.isalnum():
+            head = head.upper()
+            if head not in self.symbol_blacklist:
+                base_token = head
+        
         if not base_token:
-            for token_candidate in tek_matches:
-                token_candidate = token_candidate.upper()
-                if token_candidate not in self.symbol_blacklist:
-                    base_token = token_candidate
+            # Scan once and pick the first Form 1 token, falling back to the first
+            # Form 2 token (the regex already skips blacklisted ones)
+            tek_token = None
+            for m in self.header_regex.finditer(text):
+                gaib_candidate, tek_candidate = m.groups()
+                if gaib_candidate is not None:
+                    base_token = gaib_candidate.upper()
                     break
+                if tek_token is None:
+                    tek_token = tek_candidate.upper()
+            
+            # Check Form 2 if Form 1 didn't find anything
+            if not base_token:
+                base_token = tek_token
             
         if base_token:
-            symbols_found.add(f"{base_token}/USDT")
-            self.logger.debug(f"💎 Found structured header for token: {base_token}")
-            self.logger.info(f"✅ HEADER MATCH: {base_token}/USDT")  # NEW: Confirm header detection
+            symbols_found.add((base_token, 'USDT'))
+            self.logger.debug("💎 Found structured header for token: %s", base_token)
+            self.logger.info("✅ HEADER MATCH: %s/USDT", base_token)  # NEW: Confirm header detection
         else:
             # Fallback for simple "BTC/USDT" format
             pair_matches = self.pair_regex.findall(text)
             for base, quote in pair_matches:
+                base = base.upper()
+                quote = quote.upper()
                 if base not in self.symbol_blacklist:
-                    symbols_found.add(f"{base}/{quote}")
+                    symbols_found.add((base, quote))
 
         if not symbols_found:
-            self.logger.debug(f"ℹ️ No trading symbols found in message")
-            self.logger.info(f"⚠️ NO SYMBOLS DETECTED. Text preview: {text[:150]}")  # NEW: Show why nothing matched
+            self.logger.debug("ℹ️ No trading symbols found in message")
+            self.logger.info("⚠️ NO SYMBOLS DETECTED. Text preview: %.150s", text)  # NEW: Show why nothing matched
             return
 
         # 2. Extract Specialized Metadata
@@ -236,79 +408,132 @@ class TelegramSignalManager:
             try:
                 val_str = spread_match.group(1).replace(',', '.')
                 reported_spread = float(val_str) / 100
-                self.logger.debug(f"📊 Extracted Курсовой spread: {reported_spread:.2%}")
+                self.logger.debug("📊 Extracted Курсовой spread: %.2f%%", reported_spread * 100)
             except (ValueError, IndexError):
                 pass
         
         # Direction logic: First exchange in text is LONG, second is SHORT.
         # Find all occurrences of supported exchanges in order of appearance.
         exchanges_mentioned = []
-        # Create a combined regex for all supported exchange names
-        ex_names = sorted(list(self.exchange_name_map.keys()), key=len, reverse=True)
-        ex_regex = re.compile(r'\b(' + '|'.join(map(re.escape, ex_names)) + r')\b', re.IGNORECASE)
-        
-        found_ex_matches = ex_regex.finditer(text)
+        found_ex_matches = self.exchange_regex.finditer(text)
+        name_map = self.exchange_name_map
         
         for m in found_ex_matches:
-            ex_name_raw = m.group(1).lower()
-            internal_name = self.exchange_name_map[ex_name_raw]
+            ex_name_raw = m.group(1)
+            # Names usually arrive lowercase; other casings are normalized per
+            # match rather than cached, since message text is untrusted
+            internal_name = name_map.get(ex_name_raw)
+            if internal_name is None:
+                internal_name = name_map.get(self._exchange_key(ex_name_raw))
+                if internal_name is None:
+                    continue
             if internal_name not in exchanges_mentioned:
                 exchanges_mentioned.append(internal_name)
         
         # Strict Rule: 1st=LONG, 2nd=SHORT
         direction = "SHORT" # Signal recommendation is for the bot's action (usually the second side)
         if len(exchanges_mentioned) >= 2:
-            self.logger.info(f"🏛️ Exchange order: 1st={exchanges_mentioned[0]} (LONG), 2nd={exchanges_mentioned[1]} (SHORT)")
+            self.logger.info("🏛️ Exchange order: 1st=%s (LONG), 2nd=%s (SHORT)", exchanges_mentioned[0], exchanges_mentioned[1])
         elif exchanges_mentioned:
-            self.logger.info(f"🏛️ Single exchange detected: {exchanges_mentioned[0]}")
+            self.logger.info("🏛️ Single exchange detected: %s", exchanges_mentioned[0])
         
         # Log detected exchanges
         if exchanges_mentioned:
-            self.logger.info(f"🏛️ Exchanges in signal: {exchanges_mentioned}")
+            self.logger.info("🏛️ Exchanges in signal: %s", exchanges_mentioned)
+
+        # The exchange pair is the same for every symbol in the message
+        # (Strict Rule: 1st=LONG, 2nd=SHORT)
+        is_custom_pair = len(exchanges_mentioned) >= 2
+        if is_custom_pair:
+            pair = (exchanges_mentioned[0], exchanges_mentioned[1])
+        elif len(exchanges_mentioned) == 1:
+            # One exchange mentioned, use bybit as fallback second exchange (SHORT side)
+            pair = (exchanges_mentioned[0], 'bybit') if exchanges_mentioned[0] != 'bybit' else ('bingx', 'bybit')
+        else:
+            pair = ('bingx', 'bybit')
 
-        for symbol in symbols_found:
+        manual_map = self.symbol_mapping
+        for base, quote in symbols_found:
             # Check for manual mapping in config first
-            manual_map = self.tg_config.get('symbol_mapping', {})
-            base, quote = symbol.split('/')
             if base in manual_map:
                 symbol = f"{manual_map[base]}/{quote}"
-                self.logger.info(f"🔄 Symbol remapped via config: {base} -> {manual_map[base]}")
+                self.logger.info("🔄 Symbol remapped via config: %s -> %s", base, manual_map[base])
+            else:
+                symbol = f"{base}/{quote}"
 
-            # Resolve exchange-specific symbols
-            ex_a, ex_b = pair if 'pair' in locals() else ('bingx', 'bybit')
-            ex_a_obj = self.validator.exchanges.get(ex_a)
-            ex_b_obj = self.validator.exchanges.get(ex_b)
-            
-            # Resolve if obj exists, otherwise validator.analyze will handle it later
-            # but we need it here for immediate logging if possible
-            # To be safe, we just use the names for now as resolve() needs exchange objects
-            # which might not be initialized yet in validator.
+            # Exchange-specific symbols are resolved later by the validator and LiveMonitor,
+            # which own the exchange objects
             
             self.logger.info(
-                f"📍 Signal detected for {symbol} | Direction: {direction} | Spread: {reported_spread:.2%}"
+                "📍 Signal detected for %s | Direction: %s | Spread: %.2f%%",
+                symbol, direction, reported_spread * 100
             )
             
             # Start asynchronous validation/monitoring flow
+            # Finished tasks remove themselves (see _forget_signal); the done()
+            # check covers a task that finished before its callback has run
             if symbol not in self.active_signals or self.active_signals[symbol].done():
-                # Determine exchange pair (Strict Rule: 1st=LONG, 2nd=SHORT)
-                if len(exchanges_mentioned) >= 2:
-                    pair = (exchanges_mentioned[0], exchanges_mentioned[1])
-                    self.logger.info(f"⚖️ Arbitrage Pair: LONG on {pair[0]} | SHORT on {pair[1]}")
-                elif len(exchanges_mentioned) == 1:
-                    # One exchange mentioned, use bybit as fallback second exchange (SHORT side)
-                    pair = (exchanges_mentioned[0], 'bybit') if exchanges_mentioned[0] != 'bybit' else ('bingx', 'bybit')
-                else:
-                    pair = ('bingx', 'bybit')
+                if is_custom_pair:
+                    self.logger.info("⚖️ Arbitrage Pair: LONG on %s | SHORT on %s", pair[0], pair[1])
                 
                 metadata = {
                     'direction': direction, 
                     'reported_spread': reported_spread,
                     'pair': pair,
-                    'is_custom_pair': len(exchanges_mentioned) >= 2
+                    'is_custom_pair': is_custom_pair
                 }
                 task = asyncio.create_task(self._validate_and_confirm(symbol, message, metadata))
+                task.add_done_callback(lambda t, s=symbol: self._forget_signal(s, t))
                 self.active_signals[symbol] = task
 
+    def _forget_signal(self, symbol: str, task: asyncio.Task) -> None:
+        """
+        Drop a finished validation task from active_signals.
+        
+        Args:
+            symbol: Symbol the task was validating
+            task: The finished task
+        """
+        if self.active_signals.get(symbol) is task:
+            del self.active_signals[symbol]
+
+    async def _analyze_cached(self, symbol: str, ex_a: str, ex_b: str) -> dict:
+        """
+        Run historical validation, reusing a result younger than adf_cache_ttl.
+        
+        Failed runs (results with an 'error') are not cached.
+        
+        Args:
+            symbol: Trading pair symbol
+            ex_a: First exchange ID
+            ex_b: Second exchange ID
+        
+        Returns:
+            Results dict from HistoricalValidator.analyze
+        """
+        key = (symbol, ex_a, ex_b)
+        now = time.monotonic()
+        cached = self._adf_cache.get(key)
+        if cached is not None and cached[0] > now:
+            self.logger.info(f"♻️ Reusing ADF result for {symbol} on {ex_a}/{ex_b}")
+            return cached[1]
+        
+        results = await self.validator.analyze(
+            symbol=symbol,
+            ex_a=ex_a,
+            ex_b=ex_b,
+            timeframe=self.adf_timeframe, 
+            limit=self.adf_candles
+        )
+        
+        if self.adf_cache_ttl > 0 and 'error' not in results:
+            now = time.monotonic()
+            # Drop expired entries so the cache only holds recently signalled pairs
+            for stale in [k for k, (expires_at, _) in self._adf_cache.items() if expires_at <= now]:
+                del self._adf_cache[stale]
+            self._adf_cache[key] = (now + self.adf_cache_ttl, results)
+        return results
+
     async def _validate_and_confirm(self, symbol: str, original_msg: Message, metadata: dict):
         """
         Flow:
@@ -320,7 +545,7 @@ class TelegramSignalManager:
         """
         try:
             # Check reported spread filter (using absolute value for magnitude)
-            min_repo_spread = self.tg_config.get('min_signal_spread_pct', 0.0)
+            min_repo_spread = self.min_signal_spread_pct
             if abs(metadata['reported_spread']) < min_repo_spread:
                 self.logger.info(
                     f"⏩ {symbol} reported spread {metadata['reported_spread']:.2%} "
@@ -331,13 +556,7 @@ class TelegramSignalManager:
             # 1. Historical Validation (ADF test)
             ex_a, ex_b = metadata.get('pair', ('bingx', 'bybit'))
             self.logger.info(f"🔍 Running ADF test for {symbol} on {ex_a}/{ex_b}...")
-            results = await self.validator.analyze(
-                symbol=symbol,
-                ex_a=ex_a,
-                ex_b=ex_b,
-                timeframe=self.adf_timeframe, 
-                limit=self.adf_candles
-            )
+            results = await self._analyze_cached(symbol, ex_a, ex_b)
             
             if not results.get('is_stationary', False):
                 self.logger.info(f"❌ {symbol} failed ADF stationarity check. Ignoring signal.")
@@ -355,19 +574,26 @@ class TelegramSignalManager:
             else:
                 await self.monitor.start([symbol], pair=pair) 
             # 3. Wait loop for confirmation
-            start_time = time.time()
+            # Woken by LiveMonitor whenever this symbol's stats are recomputed
+            stats_event = self.monitor.stats_event(symbol)
+            latest_updates = self.monitor.latest_updates
+            deadline = time.monotonic() + self.signal_timeout
             confirmed = False
             last_stats = None
             status_msg = None
             
-            while time.time() - start_time < self.signal_timeout:
-                stats = self.monitor.get_current_stats(symbol)
-                if stats:
+            while True:
+                # Snapshot computed by the monitor on its last evaluation of this
+                # symbol; one left over from another exchange pair does not count
+                stats = latest_updates.get(symbol)
+                if stats is not None and tuple(stats.exchanges) != tuple(pair):
+                    stats = None
+                if stats is not None:
                     last_stats = stats
-                    z_score = stats.get('z_score', 0)
+                    z_score = stats.z_score
                     # net_spread_pct is reported as percentage by monitor (e.g. 1.5 for 1.5%)
                     # we convert it to fraction for comparison with config
-                    current_net_pct = abs(stats.get('net_spread_pct', 0)) / 100
+                    current_net_pct = abs(stats.net_spread_pct) / 100
                     
                     # Send status message once we have the first Z-score
                     if status_msg is None:
@@ -377,7 +603,7 @@ class TelegramSignalManager:
                                 original_msg.chat_id,
                                 f"🔍 Monitoring {symbol}...\n"
                                 f"Initial Z-Score: `{z_score:.2f}`\n"
-                                f"Target Z-Score: > `{self.tg_config.get('z_score_entry', 2.5)}`",
+                                f"Target Z-Score: > `{self.z_threshold}`",
                                 reply_to=original_msg.id
                             )
                         except Exception as e:
@@ -386,17 +612,17 @@ class TelegramSignalManager:
                             status_msg = False # Mark as attempted but failed
 
                     # Conditions (Z-score threshold and minimum profitable spread)
-                    z_cond = abs(z_score) > z_threshold
-                    spread_cond = current_net_pct > self.tg_config.get('min_spread_pct', 0.005)
+                    z_cond = abs(z_score) > self.z_threshold
+                    spread_cond = current_net_pct > self.min_spread_pct
                     
                     self.logger.debug(
-                        f"👀 Checking {symbol}: Z={z_score:.2f} (Target > {z_threshold}), "
-                        f"Spread={net_spread_pct:.2f}% (Target > 0%)"
+                        "👀 Checking %s: Z=%.2f (Target > %s), Spread=%.2f%% (Target > %.2f%%)",
+                        symbol, z_score, self.z_threshold, current_net_pct * 100, self.min_spread_pct * 100
                     )
                     
                     # Direction Match Check
                     dir_cond = True
-                    if self.tg_config.get('require_direction_match', False) and metadata['direction']:
+                    if self.require_direction_match and metadata['direction']:
                         # Logic to verify if Z-score direction matches signal recommendation
                         pass
                     
@@ -404,11 +630,18 @@ class TelegramSignalManager:
                         confirmed = True
                         break
                 
-                await asyncio.sleep(5)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(stats_event.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                stats_event.clear()
             
             if confirmed and last_stats:
-                z_score = last_stats.get('z_score', 0)
-                net_spread = last_stats.get('net_spread', 0)
+                z_score = last_stats.z_score
+                net_spread = last_stats.net_spread
                 self.logger.info(f"🚀 Signal CONFIRMED for {symbol}! Replying to Telegram...")
                 
                 conf_text = f"✅ **Confirmed!**\nZ-Score: `{z_score:.2f}`\nNet Spread: `{net_spread:.2f}%`"
@@ -430,7 +663,7 @@ class TelegramSignalManager:
                 self.logger.info(f"⏳ Signal for {symbol} timed out without confirmation.")
                 if status_msg and status_msg is not True:
                     try:
-                        last_z = f"`{last_stats['z_score']:.2f}`" if last_stats else "N/A"
+                        last_z = f"`{last_stats.z_score:.2f}`" if last_stats else "N/A"
                         await self.client.edit_message(
                             original_msg.chat_id,
                             status_msg.id,
@@ -448,10 +681,10 @@ class TelegramSignalManager:
 
 if __name__ == "__main__":
     # Test stub
-    import sys
-    loop = asyncio.get_event_loop()
+    from utils.event_loop import install_uvloop
+    get_logger(__name__).info(f"Event loop policy: {install_uvloop()}")
     manager = TelegramSignalManager()
     try:
-        loop.run_until_complete(manager.start())
+        asyncio.run(manager.start())
     except KeyboardInterrupt:
-        loop.run_until_complete(manager.stop())
+        asyncio.run(manager.stop())
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Dict, Any
 
 # Add project root to path
-sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).parent.parent))
 
 from core.event_bus import EventBus
 from services.execution import ExecutionEngine
@@ -22,10 +22,22 @@ class MockWSManager:
     def get_latest_price(self, exchange: str, symbol: str) -> Dict[str, float]:
         return self.prices.get(exchange, {}).get(symbol)
 
+async def wait_for_event(event: asyncio.Event, timeout: float = 2.0) -> bool:
+    """Wait until event is set or the timeout expires."""
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
 async def simulate_flow():
     setup_logger('simulation', level='INFO')
     bus = EventBus.instance()
     mock_ws = MockWSManager()
+    trade_opened = asyncio.Event()
+    trade_closed = asyncio.Event()
+    bus.trade_opened.connect(lambda _: trade_opened.set())
+    bus.trade_closed.connect(lambda _: trade_closed.set())
     
     # Path to paper state
     state_file = Path('data/paper_state.json')
@@ -44,9 +56,7 @@ async def simulate_flow():
     bus.emit_signal_triggered('BTC/USDT', 'ENTRY', 3.5, 'bingx', 'bybit')
     
     # Give it time to execute
-    await asyncio.sleep(1)
-    
-    if 'BTC/USDT' in engine.active_trades:
+    if await wait_for_event(trade_opened) and 'BTC/USDT' in engine.active_trades:
         print("✅ Trade successfully opened and tracked in ExecutionEngine.")
     else:
         print("❌ Trade NOT opened. Check logs.")
@@ -66,9 +76,7 @@ async def simulate_flow():
     bus.emit_signal_triggered('BTC/USDT', 'EXIT', 0.5, 'bingx', 'bybit')
     
     # Give it time to execute
-    await asyncio.sleep(1)
-    
-    if 'BTC/USDT' not in engine.active_trades:
+    if await wait_for_event(trade_closed) and 'BTC/USDT' not in engine.active_trades:
         print("✅ Trade successfully closed.")
         print(f"📈 Total Trades: {engine.total_trades}")
         print(f"💰 Cumulative P&L: ${engine.cumulative_pnl:.2f}")
@@ -0,0 +1,107 @@
+"""
+Test script for the compiled ADF regression.
+
+This script verifies that:
+1. adf_regression() selects the same lag as statsmodels adfuller (AIC)
+2. The ADF statistic and observation count match adfuller
+3. adf_test() reports the same p-value and critical values
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.stattools import adfuller
+
+from utils._adf_kernels import adf_regression
+from utils import metrics
+from utils.metrics import adf_test
+
+
+def _sample_series():
+    """Random walks, AR(1) processes and rounded price spreads of various lengths."""
+    rng = np.random.default_rng(42)
+    for n in (30, 100, 300, 1000):
+        noise = rng.normal(size=n)
+        yield noise.cumsum()
+
+        ar = np.zeros(n)
+        for i in range(1, n):
+            ar[i] = 0.7 * ar[i - 1] + noise[i]
+        yield ar
+
+        price_a = 100 + rng.normal(size=n).cumsum() * 0.01
+        price_b = price_a + rng.normal(scale=0.02, size=n)
+        yield np.round(price_a - price_b, 3)
+
+
+def test_adf_regression_matches_statsmodels():
+    """Compare lag selection, statistic and nobs with adfuller(autolag='AIC')."""
+
+    print("=" * 70)
+    print("Testing adf_regression() against statsmodels adfuller")
+    print("=" * 70)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for x in _sample_series():
+            ref = adfuller(x, autolag='AIC')
+            adf_stat, used_lag, n_obs = adf_regression(x)
+
+            print(f"  n={len(x):5d}  stat={adf_stat:9.4f} (ref {ref[0]:9.4f})  lag={used_lag} (ref {ref[2]})")
+            assert used_lag == ref[2]
+            assert n_obs == ref[3]
+            assert abs(adf_stat - ref[0]) <= 1e-9 * max(1.0, abs(ref[0]))
+
+    print("\n✅ adf_regression() matches adfuller")
+
+
+def test_adf_test_p_values():
+    """adf_test() should report the same p-value and critical values as adfuller."""
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for x in _sample_series():
+            is_stationary, p_value, details = adf_test(pd.Series(x))
+            ref = adfuller(x, autolag='AIC')
+
+            assert abs(p_value - ref[1]) <= 1e-9
+            assert is_stationary == (ref[1] < 0.05)
+            for level, value in ref[4].items():
+                assert abs(details['critical_values'][level] - value) <= 1e-12
+
+    # Constant series cannot be tested
+    is_stationary, p_value, details = adf_test(pd.Series(np.ones(50)))
+    assert not is_stationary and p_value == 1.0 and 'error' in details
+
+    print("✅ adf_test() p-values match adfuller")
+
+
+def test_adf_test_cache():
+    """A repeated series should be served from the cache with identical results."""
+
+    x = pd.Series(next(_sample_series()))
+    metrics._ADF_CACHE.clear()
+
+    first = adf_test(x)
+    assert len(metrics._ADF_CACHE) == 1
+
+    second = adf_test(x.copy())
+    assert len(metrics._ADF_CACHE) == 1
+    assert first == second
+
+    # Callers get their own details dict
+    second[2]['critical_values']['5%'] = 0.0
+    assert adf_test(x)[2] == first[2]
+
+    # Different data is a different entry
+    adf_test(x * 2)
+    assert len(metrics._ADF_CACHE) == 2
+
+    print("✅ adf_test() reuses cached results")
+
+
+if __name__ == "__main__":
+    test_adf_regression_matches_statsmodels()
+    test_adf_test_p_values()
+    test_adf_test_cache()
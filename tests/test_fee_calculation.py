@@ -5,15 +5,13 @@ This script verifies that:
 1. calculate_net_spread() works correctly
 2. Net spread is properly calculated (Gross - Fees)
 3. Fee percentages are accurate
+4. calculate_spread_stats() gross/net statistics
 """
 
-import sys
-from pathlib import Path
+import numpy as np
+import pandas as pd
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from utils.metrics import calculate_net_spread
+from utils.metrics import calculate_net_spread, calculate_spread_stats
 
 
 def test_calculate_net_spread():
@@ -100,5 +98,64 @@ def test_calculate_net_spread():
     print("=" * 70)
 
 
+def test_calculate_net_spread_vectorized():
+    """Array inputs should give the same results as the scalar calls, element by element."""
+    
+    print("\n📊 Vectorized calculate_net_spread()")
+    fee_bingx = 0.0005
+    fee_bybit = 0.00055
+    breakeven_gross = 50000.0 * (fee_bingx + fee_bybit)
+    
+    gross = np.array([100.0, 30.0, 0.0, breakeven_gross, 10.0])
+    price = np.array([50000.0, 50000.0, 50000.0, 50000.0, 0.0])
+    
+    net_val, net_pct, fee_cost = calculate_net_spread(gross, price, fee_bingx, fee_bybit)
+    
+    expected = np.array([calculate_net_spread(g, p, fee_bingx, fee_bybit) for g, p in zip(gross, price)])
+    print(f"  Net Spread: {net_val}")
+    print(f"  Net Spread %: {net_pct}")
+    
+    assert np.allclose(net_val, expected[:, 0])
+    assert np.allclose(net_pct, expected[:, 1])
+    assert np.allclose(fee_cost, expected[:, 2])
+    assert net_val[1] < 0 and abs(net_val[3]) < 0.01
+    # Non-positive price yields zeros, as in the scalar path
+    assert net_val[4] == 0.0 and net_pct[4] == 0.0 and fee_cost[4] == 0.0
+    print("  ✅ PASS")
+
+
+def test_calculate_spread_stats():
+    """Statistics should match pandas on the NaN-free data, net values shifted by the fee."""
+    
+    print("\n📊 calculate_spread_stats()")
+    
+    rng = np.random.default_rng(3)
+    values = rng.normal(loc=20.0, scale=15.0, size=200)
+    values[rng.random(200) < 0.1] = np.nan
+    series = pd.Series(values)
+    clean = series.dropna()
+    
+    stats = calculate_spread_stats(series, price=50000.0, taker_fee_a=0.0005, taker_fee_b=0.00055)
+    fee_cost = 50000.0 * (0.0005 + 0.00055)
+    
+    assert stats['count'] == len(clean)
+    assert abs(stats['fee_cost'] - fee_cost) < 1e-12
+    assert abs(stats['fee_pct'] - 0.105) < 1e-12
+    for name, expected in (('mean', clean.mean()), ('std', clean.std()), ('min', clean.min()),
+                           ('max', clean.max()), ('current', clean.iloc[-1]), ('median', clean.median())):
+        assert abs(stats[f'gross_{name}'] - expected) < 1e-9, name
+        net_expected = (clean - fee_cost).std() if name == 'std' else expected - fee_cost
+        assert abs(stats[f'net_{name}'] - net_expected) < 1e-9, name
+    
+    # Without fees only gross statistics; empty input is an error
+    assert 'net_mean' not in calculate_spread_stats(series)
+    assert np.isnan(calculate_spread_stats(pd.Series([1.5]))['gross_std'])
+    assert 'error' in calculate_spread_stats(pd.Series([np.nan, np.nan]))
+    
+    print("✅ Spread statistics verified")
+
+
 if __name__ == '__main__':
     test_calculate_net_spread()
+    test_calculate_net_spread_vectorized()
+    test_calculate_spread_stats()
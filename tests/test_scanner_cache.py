@@ -0,0 +1,97 @@
+"""
+Test script for the MarketScanner REST response cache and pair pacing.
+
+This script verifies that _fetch_cached() reuses a response until cache_ttl
+seconds have passed, fetches again once it has expired, and never caches
+when cache_ttl is 0; and that pair analyses start pair_interval apart.
+"""
+
+import asyncio
+from collections import OrderedDict
+
+import services.market_scanner as market_scanner
+from services.market_scanner import MarketScanner
+
+
+class FakeExchange:
+    """Exchange stub counting ticker requests."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def fetch_ticker(self, symbol):
+        self.calls += 1
+        return {'symbol': symbol, 'last': float(self.calls)}
+
+
+def make_scanner(cache_ttl):
+    """Build a scanner around one fake exchange without loading config or markets."""
+    scanner = MarketScanner.__new__(MarketScanner)
+    scanner.exchanges = {'fake': FakeExchange()}
+    scanner._exchange_slots = {'fake': asyncio.Semaphore(1)}
+    scanner.cache_ttl = cache_ttl
+    scanner._response_cache = OrderedDict()
+    return scanner
+
+
+def test_cached_response_expires(monkeypatch):
+    """A response is reused within cache_ttl and refetched after it."""
+
+    now = [1000.0]
+    monkeypatch.setattr(market_scanner.time, 'monotonic', lambda: now[0])
+    scanner = make_scanner(cache_ttl=30)
+    exchange = scanner.exchanges['fake']
+
+    async def fetch():
+        return await scanner._fetch_cached('ticker', 'fake', 'BTC/USDT')
+
+    first = asyncio.run(fetch())
+    now[0] += 29.9
+    assert asyncio.run(fetch()) is first
+    assert exchange.calls == 1
+
+    now[0] += 0.1
+    refreshed = asyncio.run(fetch())
+    assert refreshed is not first and refreshed['last'] == 2.0
+    assert exchange.calls == 2
+
+    print("✅ Cached responses expire after cache_ttl")
+
+
+def test_zero_ttl_disables_cache():
+    """cache_ttl = 0 fetches every time and stores nothing."""
+
+    scanner = make_scanner(cache_ttl=0)
+    for _ in range(3):
+        asyncio.run(scanner._fetch_cached('ticker', 'fake', 'BTC/USDT'))
+
+    assert scanner.exchanges['fake'].calls == 3
+    assert not scanner._response_cache
+
+    print("✅ cache_ttl = 0 disables the cache")
+
+
+def test_pair_starts_are_paced():
+    """Consecutive pair analyses start at least pair_interval seconds apart."""
+
+    scanner = make_scanner(cache_ttl=30)
+    scanner.pair_interval = 0.05
+    scanner._pair_pace_lock = asyncio.Lock()
+    scanner._next_pair_at = 0.0
+
+    async def start_times():
+        loop = asyncio.get_running_loop()
+        times = []
+
+        async def one():
+            await scanner._wait_pair_turn()
+            times.append(loop.time())
+
+        await asyncio.gather(*(one() for _ in range(4)))
+        return times
+
+    times = asyncio.run(start_times())
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert all(gap >= 0.045 for gap in gaps), gaps
+
+    print("✅ Pair analyses are rate limited")
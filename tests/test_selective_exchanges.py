@@ -1,11 +1,6 @@
 import asyncio
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent.parent))
-
 from core.ws_manager import WebSocketManager
 
 async def test_selective_exchanges():
@@ -0,0 +1,42 @@
+"""
+Test script for the entry/exit signal rules.
+
+This script verifies that the vectorized is_entry_signal_batch() and
+is_exit_signal_batch() agree with the scalar is_entry_signal() and
+is_exit_signal() element by element, including NaN Z-Scores and spreads.
+"""
+
+import numpy as np
+
+from utils.metrics import is_entry_signal, is_entry_signal_batch, is_exit_signal, is_exit_signal_batch
+
+
+def test_signal_batches_match_scalar():
+    """Batch masks should equal the scalar decisions for every element."""
+
+    rng = np.random.default_rng(11)
+    z = rng.normal(scale=2.0, size=500)
+    z[::37] = np.nan
+    z[5] = 2.0  # exactly on the entry threshold
+    z[6] = -0.5  # exactly on the exit threshold
+    spread = rng.normal(loc=0.002, scale=0.003, size=500)
+    spread[::41] = np.nan
+
+    enter, direction = is_entry_signal_batch(z, 2.0, spread, 0.001)
+    enter_any_spread, _ = is_entry_signal_batch(z, 2.0)
+    exits = is_exit_signal_batch(z, 0.5)
+
+    for i in range(len(z)):
+        should_enter, reason = is_entry_signal(z[i], 2.0, spread[i], 0.001)
+        assert enter[i] == should_enter, (i, z[i], spread[i])
+        assert enter_any_spread[i] == is_entry_signal(z[i], 2.0)[0]
+        if should_enter:
+            expected = "SHORT A / LONG B" if z[i] > 0 else "LONG A / SHORT B"
+            assert expected in reason and direction[i] == (1 if z[i] > 0 else -1)
+        assert exits[i] == is_exit_signal(z[i], 0.5)[0], (i, z[i])
+
+    print("✅ Batch signal rules match the scalar functions")
+
+
+if __name__ == "__main__":
+    test_signal_batches_match_scalar()
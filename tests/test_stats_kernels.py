@@ -0,0 +1,113 @@
+"""
+Test script for the compiled rolling Z-Score.
+
+This script verifies that:
+1. calculate_z_score() matches the rolling mean/std Z-Score formula
+2. Incomplete windows, NaN gaps and constant windows come out as NaN
+3. The NumPy fallback agrees with the compiled kernel
+4. calculate_z_score_batch() matches calculate_z_score() column by column
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils import _stats_kernels
+from utils.metrics import calculate_z_score, calculate_z_score_batch
+
+
+def _pandas_z_score(series: pd.Series, window: int) -> pd.Series:
+    """The previous calculate_z_score (pandas rolling mean/std)."""
+    roll_mean = series.rolling(window=window).mean()
+    roll_std = series.rolling(window=window).std()
+    return (series - roll_mean) / roll_std.replace(0, np.nan)
+
+
+def _exact_z_score(x: np.ndarray, window: int) -> np.ndarray:
+    """Window-by-window reference, free of running-sum rounding."""
+    out = np.full(len(x), np.nan)
+    for i in range(window - 1, len(x)):
+        win = x[i - window + 1:i + 1]
+        std = np.std(win - np.mean(win), ddof=1) if window > 1 else np.nan
+        if std > 0:
+            out[i] = (x[i] - np.mean(win)) / std
+    return out
+
+
+def _sample_series():
+    """Random walks, rounded spreads, high-level prices and series with NaN gaps."""
+    rng = np.random.default_rng(7)
+    for n in (5, 50, 500):
+        yield rng.normal(size=n).cumsum()
+        yield np.round(rng.normal(size=n), 2)
+        yield 90000 + rng.normal(scale=5.0, size=n)
+
+        gappy = rng.normal(size=n)
+        gappy[rng.random(n) < 0.05] = np.nan
+        yield gappy
+
+
+def test_z_score_matches_pandas():
+    """Compare against the pandas rolling formula for several windows."""
+
+    print("=" * 70)
+    print("Testing calculate_z_score() against a window-by-window reference")
+    print("=" * 70)
+
+    for x in _sample_series():
+        series = pd.Series(x, index=pd.RangeIndex(100, 100 + len(x)), name='spread')
+        for window in (1, 2, 20, 60):
+            result = calculate_z_score(series, window=window)
+            assert result.index.equals(series.index) and result.name == 'spread'
+
+            # Same NaN layout as before; values checked against the exact reference
+            # (pandas' running sums lose digits on high price levels)
+            np.testing.assert_array_equal(result.isna().to_numpy(), _pandas_z_score(series, window).isna().to_numpy())
+            np.testing.assert_allclose(result.to_numpy(), _exact_z_score(x, window), rtol=1e-7, atol=1e-9)
+
+            fallback = np.empty(len(x))
+            _stats_kernels._rolling_z_score_numpy(x.astype(np.float64), window, fallback)
+            np.testing.assert_allclose(fallback, result.to_numpy(), rtol=1e-8, atol=1e-9)
+
+    print("\n✅ calculate_z_score() matches the reference")
+
+
+def test_z_score_constant_windows():
+    """A window with no deviation has no Z-Score."""
+
+    series = pd.Series([1.0, 2.0, 0.1, 0.1, 0.1, 0.1, 3.0])
+    z = calculate_z_score(series, window=3)
+
+    assert z.iloc[:2].isna().all()
+    assert not np.isnan(z.iloc[2]) and not np.isnan(z.iloc[3])
+    assert np.isnan(z.iloc[4]) and np.isnan(z.iloc[5])
+    assert not np.isnan(z.iloc[6])
+
+    print("✅ Constant windows give NaN")
+
+
+def test_z_score_batch():
+    """The parallel DataFrame version should equal the per-series results."""
+
+    rng = np.random.default_rng(9)
+    data = pd.DataFrame(
+        rng.normal(size=(300, 12)).cumsum(axis=0),
+        index=pd.date_range('2024-01-01', periods=300, freq='15min'),
+        columns=[f'PAIR{i}/USDT' for i in range(12)]
+    )
+    data.iloc[40:45, 3] = np.nan
+    data.iloc[:, 7] = 1.5
+
+    result = calculate_z_score_batch(data, window=20)
+
+    assert result.index.equals(data.index) and result.columns.equals(data.columns)
+    for column in data.columns:
+        expected = calculate_z_score(data[column], window=20)
+        np.testing.assert_array_equal(result[column].to_numpy(), expected.to_numpy())
+
+    print("✅ calculate_z_score_batch() matches calculate_z_score()")
+
+
+if __name__ == "__main__":
+    test_z_score_matches_pandas()
+    test_z_score_constant_windows()
+    test_z_score_batch()
@@ -1,20 +1,18 @@
 import unittest
 import asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from services.telegram_manager import TelegramSignalManager
-
-class AsyncMock(MagicMock):
-    async def __call__(self, *args, **kwargs):
-        return super(AsyncMock, self).__call__(*args, **kwargs)
+from core.event_bus import SpreadUpdate
 
 class TestTelegramParsing(unittest.TestCase):
     def setUp(self):
         # We don't want to actually connect to TG during unit tests
-        with patch('telethon.TelegramClient'), patch('services.historical_validator.HistoricalValidator'):
-            self.manager = TelegramSignalManager()
+        validator = MagicMock()
+        validator.analyze = AsyncMock()
+        with patch('telethon.TelegramClient'):
+            self.manager = TelegramSignalManager(validator=validator)
             # Mock resolver to be async
             self.manager.resolver.resolve = AsyncMock()
-            self.manager.validator.analyze = AsyncMock()
 
     def test_structured_parsing(self):
         text_gaib = """
@@ -35,27 +33,35 @@ PTBUSDT - ТЕК
 💰Спред:
 Курсовой: 1.14%
 """
-        # Test GAIB
-        symbols = set()
-        header_match = self.manager.header_gaib_regex.search(text_gaib.upper())
+        # Header tokens: Form 1 ("GAIB:") in group 1, Form 2 ("PTBUSDT - ТЕК") in group 2
+        header_match = self.manager.header_regex.search(text_gaib)
         self.assertTrue(header_match)
-        symbols.add(f"{header_match.group(1)}/USDT")
-        
-        spread_match = self.manager.course_spread_regex.search(text_gaib.upper())
-        self.assertEqual(float(spread_match.group(1).replace(',', '.')), 3.12)
+        self.assertEqual(header_match.group(1), "GAIB")
         
-        book_matches = self.manager.book_line_regex.findall(text_gaib.upper())
+        book_matches = self.manager.book_line_regex.findall(text_gaib)
         # Find bingx direction
         bingx_dir = next(d for e, ex, d in book_matches if ex.lower() == 'bingx')
-        self.assertEqual(bingx_dir, 'SHORT')
+        self.assertEqual(bingx_dir.upper(), 'SHORT')
         
-        # Test PTB
-        header_tek = self.manager.header_tek_regex.search(text_ptb.upper())
+        header_tek = self.manager.header_regex.search(text_ptb)
         self.assertTrue(header_tek)
-        self.assertEqual(header_tek.group(1), "PTB")
+        self.assertEqual(header_tek.group(2), "PTB")
         
-        spread_ptb = self.manager.course_spread_regex.search(text_ptb.upper())
-        self.assertEqual(float(spread_ptb.group(1).replace(',', '.')), 1.14)
+        # Full parse: symbol, exchange pair (1st=LONG, 2nd=SHORT) and Курсовой spread
+        self.manager._validate_and_confirm = AsyncMock()
+        for text, symbol, pair, spread in (
+            (text_gaib, 'GAIB/USDT', ('gateio', 'bingx'), 0.0312),
+            (text_ptb, 'PTB/USDT', ('bingx', 'bybit'), 0.0114),
+        ):
+            msg = MagicMock()
+            msg.text = text
+            self.manager._validate_and_confirm.reset_mock()
+            asyncio.run(self.manager._process_message(msg))
+            
+            args, _ = self.manager._validate_and_confirm.call_args
+            self.assertEqual(args[0], symbol)
+            self.assertEqual(args[2]['pair'], pair)
+            self.assertAlmostEqual(args[2]['reported_spread'], spread, places=6)
 
     def test_link_stripping_and_blacklist(self):
         # Even if it looks like a structured header, it should be ignored if it's HTTPS
@@ -72,30 +78,34 @@ PTBUSDT - ТЕК
         # Should NOT have called _validate_and_confirm for HTTPS
         self.assertFalse(self.manager._validate_and_confirm.called, "Should not detect HTTPS/USDT from link")
 
-    @patch('services.historical_validator.HistoricalValidator.analyze')
-    @patch('services.live_monitor.LiveMonitor.get_current_stats')
     @patch('services.live_monitor.LiveMonitor.start')
     @patch('asyncio.sleep', new_callable=AsyncMock)
-    def test_validation_logic(self, mock_sleep, mock_ws_start, mock_get_stats, mock_analyze):
+    def test_validation_logic(self, mock_sleep, mock_ws_start):
         # Mock historical validation passing
-        mock_analyze.return_value = {'is_stationary': True}
+        self.manager.validator.analyze.return_value = {'is_stationary': True}
         
-        # Mock live monitoring stats
-        mock_get_stats.return_value = {
-            'z_score': 3.0,
-            'net_spread': 0.005 # Positive
-        }
+        # Mock live monitoring stats (net_spread_pct is in percent)
+        self.manager.monitor.latest_updates['BTC/USDT'] = SpreadUpdate(
+            symbol='BTC/USDT', gross_spread=0.0, gross_spread_pct=0.0, fee_cost=0.0, fee_pct=0.0,
+            net_spread=0.005,  # Positive
+            net_spread_pct=1.5, z_score=3.0, mid_price=0.0, exchanges=('bingx', 'bybit')
+        )
         
         # Setup a mock message
         mock_msg = MagicMock()
         mock_msg.text = "BTC/USDT Signal"
-        mock_msg.reply = AsyncMock()
-        
-        # Ensure config has thresholds
-        self.manager.validator.config = {
-            'trading': {'z_score_entry': 2.0}
-        }
-        self.manager.signal_timeout = 10 # Shorten for test
+        mock_msg.chat_id = 42
+        mock_msg.id = 7
+        
+        # Telegram client: status message is sent, then edited on confirmation
+        self.manager.client = AsyncMock()
+        status_msg = MagicMock(id=99)
+        self.manager.client.send_message.return_value = status_msg
+        
+        # Thresholds the stats above satisfy, and a short confirmation timeout
+        self.manager.z_threshold = 2.0
+        self.manager.min_spread_pct = 0.005
+        self.manager.signal_timeout = 1
 
         # Run the internal validation method
         async def run_test():
@@ -104,10 +114,17 @@ PTBUSDT - ТЕК
                 'direction': 'LONG'
             }
             await self.manager._validate_and_confirm("BTC/USDT", mock_msg, metadata)
-            # Verify it replied
-            mock_msg.reply.assert_called_with("✅")
 
         asyncio.run(run_test())
+        
+        mock_ws_start.assert_called_once()
+        self.manager.client.send_message.assert_called_once()
+        self.assertEqual(self.manager.client.send_message.call_args.kwargs['reply_to'], 7)
+        # Verify the status message was edited into the confirmation
+        self.manager.client.edit_message.assert_called_once()
+        chat_id, msg_id, text = self.manager.client.edit_message.call_args.args
+        self.assertEqual((chat_id, msg_id), (42, 99))
+        self.assertIn("Confirmed", text)
 
     def test_exchange_filter(self):
         # Case 1: Mentions BingX (Supported)
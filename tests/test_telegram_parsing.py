@@ -1,30 +1,34 @@
-import asyncio
 import unittest
 from unittest.mock import MagicMock, AsyncMock
 import sys
-from pathlib import Path
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent.parent))
+# Mock dependencies only while importing TelegramSignalManager, then put the
+# real modules back so test modules collected later are not affected
+_stubs = {
+    'telethon': MagicMock(),
+    'telethon.sync': MagicMock(),
+    'telethon.sessions': MagicMock(),
+    'telethon.tl': MagicMock(),
+    'telethon.tl.types': MagicMock(),
+    'telethon.events': MagicMock(),
+    'services.historical_validator': MagicMock(),
+    'services.live_monitor': MagicMock(),
+    'utils.logger': MagicMock(),
+    'utils.symbol_resolver': MagicMock(),
+}
+_saved = {name: sys.modules.get(name) for name in [*_stubs, 'services.telegram_manager']}
+sys.modules.update(_stubs)
+sys.modules.pop('services.telegram_manager', None)
+try:
+    from services.telegram_manager import TelegramSignalManager
+finally:
+    for name, module in _saved.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
 
-# Mock dependencies
-from unittest.mock import MagicMock
-telethon = MagicMock()
-sys.modules['telethon'] = telethon
-sys.modules['telethon.sync'] = MagicMock()
-sys.modules['telethon.sessions'] = MagicMock()
-sys.modules['telethon.tl'] = MagicMock()
-sys.modules['telethon.tl.types'] = MagicMock()
-sys.modules['telethon.events'] = MagicMock()
-
-sys.modules['services.historical_validator'] = MagicMock()
-sys.modules['services.live_monitor'] = MagicMock()
-sys.modules['utils.logger'] = MagicMock()
-sys.modules['utils.symbol_resolver'] = MagicMock()
-
-from services.telegram_manager import TelegramSignalManager
-
-class TestTelegramParsing(unittest.TestCase):
+class TestTelegramParsing(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         # Mock Config
         mock_config = {
@@ -49,7 +53,7 @@ class TestTelegramParsing(unittest.TestCase):
             'bybit': MagicMock()
         }
 
-    def test_river_signal_parsing(self):
+    async def test_river_signal_parsing(self):
         """
         Verify that the RIVER signal is parsed correctly (8.37% not -7.72%).
         And direction is correct (huobi=LONG, bybit=SHORT).
@@ -72,7 +76,7 @@ RIVER: huobi-bybit 8.37% курс. спред
         mock_msg.text = sample_text
         
         self.manager._validate_and_confirm = AsyncMock()
-        asyncio.run(self.manager._process_message(mock_msg))
+        await self.manager._process_message(mock_msg)
         
         args, kwargs = self.manager._validate_and_confirm.call_args
         metadata = args[2]
@@ -89,7 +93,7 @@ RIVER: huobi-bybit 8.37% курс. спред
         # huobi-bybit order -> huobi (htx) is LONG, bybit is SHORT
         self.assertEqual(pair, ('htx', 'bybit'))
 
-    def test_reversed_exchange_direction(self):
+    async def test_reversed_exchange_direction(self):
         """
         Verify that order determines direction: bybit-huobi -> bybit=LONG, htx=SHORT
         """
@@ -98,7 +102,7 @@ RIVER: huobi-bybit 8.37% курс. спред
         mock_msg.text = sample_text
         
         self.manager._validate_and_confirm = AsyncMock()
-        asyncio.run(self.manager._process_message(mock_msg))
+        await self.manager._process_message(mock_msg)
         
         args, kwargs = self.manager._validate_and_confirm.call_args
         pair = args[2]['pair']
@@ -106,5 +110,73 @@ RIVER: huobi-bybit 8.37% курс. спред
         print(f"Detected pair (reversed): {pair}")
         self.assertEqual(pair, ('bybit', 'htx'))
 
+    async def test_non_ascii_exchange_casing(self):
+        """
+        Verify that IGNORECASE matches with non-ASCII case variants (dotless 'ı',
+        dotted 'İ') map to their exchange instead of raising KeyError
+        """
+        sample_text = "RIVER: BıNGX-BYBİT Курсовой: 5.0%"
+        mock_msg = MagicMock()
+        mock_msg.text = sample_text
+        
+        self.manager._validate_and_confirm = AsyncMock()
+        await self.manager._process_message(mock_msg)
+        
+        args, kwargs = self.manager._validate_and_confirm.call_args
+        self.assertEqual(args[2]['pair'], ('bingx', 'bybit'))
+
+    async def test_markdown_stripping(self):
+        """
+        Verify that links, bold/italic markers, backticks and URLs are stripped before parsing
+        """
+        sample_text = "**GAIB:** [gate.io](https://gate.io/futures/GAIB_USDT) - `bybit` _Курсовой_: ~3,5%~ https://t.me/x_y"
+        mock_msg = MagicMock()
+        mock_msg.text = sample_text
+
+        self.manager._validate_and_confirm = AsyncMock()
+        await self.manager._process_message(mock_msg)
+
+        args, kwargs = self.manager._validate_and_confirm.call_args
+        metadata = args[2]
+
+        print(f"Detected pair (markdown): {metadata['pair']}")
+        self.assertEqual(args[0], 'GAIB/USDT')
+        self.assertEqual(metadata['pair'], ('gateio', 'bybit'))
+        self.assertAlmostEqual(metadata['reported_spread'], 0.035, places=4)
+
+    async def test_noise_message_skipped(self):
+        """
+        Verify that messages without any symbol marker return before parsing
+        """
+        mock_msg = MagicMock()
+        mock_msg.text = "Good morning everyone 📗 stay tuned for today's signals"
+
+        self.manager._validate_and_confirm = AsyncMock()
+        await self.manager._process_message(mock_msg)
+
+        self.manager._validate_and_confirm.assert_not_called()
+        self.manager.logger.info.assert_not_called()
+
+    async def test_adf_result_cache(self):
+        """
+        Verify that a repeat signal reuses the ADF result and failed runs are not cached
+        """
+        self.manager.adf_cache_ttl = 900
+        self.manager.validator.analyze = AsyncMock(return_value={'is_stationary': True})
+
+        first = await self.manager._analyze_cached('GAIB/USDT', 'gateio', 'bybit')
+        second = await self.manager._analyze_cached('GAIB/USDT', 'gateio', 'bybit')
+        self.assertIs(first, second)
+        self.assertEqual(self.manager.validator.analyze.await_count, 1)
+
+        # Different pair is a different key
+        await self.manager._analyze_cached('GAIB/USDT', 'bybit', 'gateio')
+        self.assertEqual(self.manager.validator.analyze.await_count, 2)
+
+        self.manager.validator.analyze = AsyncMock(return_value={'error': 'Data fetch failed'})
+        await self.manager._analyze_cached('RIVER/USDT', 'htx', 'bybit')
+        await self.manager._analyze_cached('RIVER/USDT', 'htx', 'bybit')
+        self.assertEqual(self.manager.validator.analyze.await_count, 2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,7 +3,7 @@ import sys
 from pathlib import Path
 
 # Add project root to path
-sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).parent.parent))
 
 from core.event_bus import EventBus
 from services.execution import ExecutionEngine
@@ -12,6 +12,8 @@ from utils.logger import setup_logger
 async def test_execution():
     setup_logger('test_execution', level='INFO')
     bus = EventBus.instance()
+    trade_opened = asyncio.Event()
+    bus.trade_opened.connect(lambda _: trade_opened.set())
     
     print("Initializing Multi-Exchange ExecutionEngine...")
     engine = ExecutionEngine(
@@ -26,8 +28,12 @@ async def test_execution():
     print("Emitting mock ENTRY signal for BTC/USDT (bingx <-> bybit)...")
     bus.emit_signal_triggered('BTC/USDT', 'ENTRY', 3.0, 'bingx', 'bybit')
     
-    # Wait a bit for async task to process
-    await asyncio.sleep(2)
+    # Wait for the engine to open the trade (or give up after 2s)
+    try:
+        await asyncio.wait_for(trade_opened.wait(), timeout=2.0)
+        print("Trade opened.")
+    except asyncio.TimeoutError:
+        print("No trade opened within 2s.")
     
     print("\nTest complete. Check logs for '🚀 Opening arbitrage' or balance errors.")
 
@@ -2,7 +2,22 @@
 Utility modules for ArbiBot
 """
 
-from .metrics import calculate_z_score, adf_test, calculate_spread
-from .logger import setup_logger
+import importlib
 
 __all__ = ['calculate_z_score', 'adf_test', 'calculate_spread', 'setup_logger']
+
+# Re-exports are resolved lazily so importing a lightweight submodule
+# (e.g. utils.logger) does not pull in pandas/statsmodels via utils.metrics.
+_LAZY_EXPORTS = {
+    'calculate_z_score': '.metrics',
+    'adf_test': '.metrics',
+    'calculate_spread': '.metrics',
+    'setup_logger': '.logger',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
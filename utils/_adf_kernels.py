@@ -0,0 +1,158 @@
+"""
+Numeric kernels for the ADF stationarity test
+
+Reproduces the regression part of statsmodels' ``adfuller(x, regression='c',
+autolag='AIC')``: the AIC lag search and the t-statistic of the lagged level.
+Compiled with Numba (cached, GIL released) when it is installed; callers fall
+back to statsmodels otherwise.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _adf_design(x, xdiff, nlags, nobs, const_first):
+    """
+    Build the ADF regression matrix for the last ``nobs`` differences.
+
+    Args:
+        x: Series levels
+        xdiff: First differences of x
+        nlags: Number of lagged differences
+        nobs: Number of rows (observations)
+        const_first: Put the constant in column 0 instead of the last column
+
+    Returns:
+        (nobs, nlags + 2) float64 matrix: [const,] level, diff lags 1..nlags [, const]
+    """
+    ncols = nlags + 2
+    X = np.empty((nobs, ncols))
+    first = len(xdiff) - nobs
+    offset = 1 if const_first else 0
+    const_col = 0 if const_first else ncols - 1
+    for i in range(nobs):
+        t = first + i
+        X[i, const_col] = 1.0
+        X[i, offset] = x[t]
+        for j in range(1, nlags + 1):
+            X[i, offset + j] = xdiff[t - j]
+    return X
+
+
+def _check_rank(r):
+    """Raise if the triangular factor is (numerically) rank deficient."""
+    n = r.shape[1]
+    scale = 0.0
+    for j in range(n):
+        scale = max(scale, abs(r[j, j]))
+    tol = scale * max(r.shape[0], n) * 2.220446049250313e-16
+    for j in range(n):
+        if abs(r[j, j]) <= tol:
+            raise ValueError("ADF design matrix is rank deficient")
+
+
+def _adf_core(x, maxlag):
+    """
+    AIC lag selection followed by the final ADF regression.
+
+    Args:
+        x: Series levels (float64, no NaNs)
+        maxlag: Maximum number of lagged differences to consider
+
+    Returns:
+        Tuple of (adf_statistic, used_lag, n_observations)
+    """
+    xdiff = x[1:] - x[:-1]
+
+    # Lag search: all candidates share the rows left after trimming maxlag lags,
+    # and each candidate uses a column prefix of [const, level, d1..d_maxlag],
+    # so one QR gives every candidate's SSR
+    nobs = len(xdiff) - maxlag
+    X = _adf_design(x, xdiff, maxlag, nobs, True)
+    y = xdiff[len(xdiff) - nobs:].copy()
+    q, r = np.linalg.qr(X)
+    _check_rank(r)
+    qty = q.T.copy() @ y
+    resid = y - q @ qty
+    ssr_full = np.dot(resid, resid)
+
+    nobs2 = nobs / 2.0
+    best_aic = np.inf
+    best_k = 0
+    tail = 0.0
+    ncols = maxlag + 2
+    ssr_by_k = np.empty(ncols + 1)
+    for k in range(ncols, 0, -1):
+        ssr_by_k[k] = ssr_full + tail
+        tail += qty[k - 1] * qty[k - 1]
+    for k in range(2, ncols + 1):
+        llf = -nobs2 * np.log(2 * np.pi) - nobs2 * np.log(ssr_by_k[k] / nobs) - nobs2
+        aic = -2.0 * llf + 2.0 * k
+        if aic < best_aic:
+            best_aic = aic
+            best_k = k
+    used_lag = best_k - 2
+
+    # Final regression with the selected lag on all available rows
+    nobs = len(xdiff) - used_lag
+    X = _adf_design(x, xdiff, used_lag, nobs, False)
+    y = xdiff[len(xdiff) - nobs:].copy()
+    q, r = np.linalg.qr(X)
+    _check_rank(r)
+    qty = q.T.copy() @ y
+    beta = np.linalg.solve(r, qty)
+    resid = y - X @ beta
+    ssr = np.dot(resid, resid)
+    ncols = used_lag + 2
+    scale = ssr / (nobs - ncols)
+    r_inv = np.linalg.inv(r)
+    var0 = 0.0
+    for j in range(ncols):
+        var0 += r_inv[0, j] * r_inv[0, j]
+    return beta[0] / np.sqrt(scale * var0), used_lag, nobs
+
+
+if HAS_NUMBA:
+    _adf_design = njit(cache=True, nogil=True)(_adf_design)
+    _check_rank = njit(cache=True, nogil=True)(_check_rank)
+    _adf_core = njit(cache=True, nogil=True)(_adf_core)
+
+
+def adf_regression(x: np.ndarray) -> Tuple[float, int, int]:
+    """
+    Compute the ADF statistic with a constant and AIC lag selection.
+
+    Same lag bound and selection rule as statsmodels ``adfuller``.
+
+    Args:
+        x: Series values (NaNs already dropped)
+
+    Returns:
+        Tuple of (adf_statistic, used_lag, n_observations)
+
+    Raises:
+        ValueError: Constant or too short series, or a rank-deficient design
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    if x.max() == x.min():
+        raise ValueError("Invalid input, x is constant")
+    nobs = x.shape[0]
+    maxlag = int(np.ceil(12.0 * np.power(nobs / 100.0, 1 / 4.0)))
+    maxlag = min(nobs // 2 - 2, maxlag)
+    if maxlag < 0:
+        raise ValueError("sample size is too short to use selected regression component")
+    adf_stat, used_lag, n_obs = _adf_core(x, maxlag)
+    return float(adf_stat), int(used_lag), int(n_obs)
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation (or load the on-disk cache) ahead of the first ADF test."""
+    if HAS_NUMBA:
+        adf_regression(np.random.default_rng(0).standard_normal(32).cumsum())
@@ -0,0 +1,69 @@
+"""
+Numeric kernels for LiveMonitor
+
+Compiled with Numba when it is installed; otherwise equivalent NumPy
+implementations are used so Numba stays an optional dependency.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _ring_append_loop(buf, head, count, value):
+    """
+    Write a value into a ring buffer and return the updated baseline statistics.
+
+    Args:
+        buf: Preallocated float64 ring buffer (modified in place)
+        head: Next write position
+        count: Number of samples currently stored
+        value: New sample
+
+    Returns:
+        Tuple of (new_head, new_count, mean, population_std)
+    """
+    size = buf.shape[0]
+    buf[head] = value
+    head = (head + 1) % size
+    if count < size:
+        count += 1
+
+    total = 0.0
+    for i in range(count):
+        total += buf[i]
+    mean = total / count
+
+    sq = 0.0
+    for i in range(count):
+        diff = buf[i] - mean
+        sq += diff * diff
+    return head, count, mean, np.sqrt(sq / count)
+
+
+def _ring_append_numpy(buf: np.ndarray, head: int, count: int, value: float) -> Tuple[int, int, float, float]:
+    """NumPy fallback for :func:`_ring_append_loop` when Numba is unavailable."""
+    size = buf.shape[0]
+    buf[head] = value
+    head = (head + 1) % size
+    if count < size:
+        count += 1
+    view = buf[:count]
+    return head, count, float(view.mean()), float(view.std())
+
+
+if HAS_NUMBA:
+    ring_append = njit(cache=True)(_ring_append_loop)
+else:
+    ring_append = _ring_append_numpy
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation (or load the on-disk cache) ahead of the first tick."""
+    ring_append(np.zeros(2, dtype=np.float64), 0, 0, 0.0)
@@ -0,0 +1,156 @@
+"""
+Numeric kernels for utils.metrics
+
+Compiled with Numba when it is installed; otherwise equivalent NumPy
+implementations are used so Numba stays an optional dependency.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+
+def _rolling_z_score_loop(x, window, out):
+    """
+    Rolling Z-Score in one pass with a windowed Welford mean/variance update.
+
+    Matches ``(x - x.rolling(window).mean()) / x.rolling(window).std()`` in pandas:
+    sample standard deviation, NaN until a full window of non-NaN values, and NaN
+    where the window is constant (zero deviation).
+
+    Args:
+        x: float64 values (oldest first)
+        window: Rolling window size
+        out: float64 output array, same length as x (filled in place)
+    """
+    n = x.shape[0]
+    # Accumulate around the first value: for prices with a large level and a small
+    # spread the running mean then stays small and keeps its precision
+    shift = 0.0
+    for i in range(n):
+        if x[i] == x[i]:
+            shift = x[i]
+            break
+
+    nobs = 0
+    mean = 0.0
+    m2 = 0.0
+    # Length of the run of identical values ending at i; a window inside such a
+    # run has exactly zero deviation even if the running m2 has drifted
+    same_run = 0
+    prev = np.nan
+
+    for i in range(n):
+        # Drop the value leaving the window
+        if i >= window:
+            old = x[i - window] - shift
+            if old == old:
+                nobs -= 1
+                if nobs == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / nobs
+                    m2 -= delta * (old - mean)
+
+        # Add the new value
+        raw = x[i]
+        v = raw - shift
+        if v == v:
+            nobs += 1
+            delta = v - mean
+            mean += delta / nobs
+            m2 += delta * (v - mean)
+            same_run = same_run + 1 if raw == prev else 1
+        else:
+            same_run = 0
+        prev = raw
+
+        if window < 2 or nobs < window or same_run >= window or m2 <= 0.0:
+            out[i] = np.nan
+        else:
+            out[i] = (v - mean) / np.sqrt(m2 / (window - 1))
+
+
+def _rolling_z_score_numpy(x: np.ndarray, window: int, out: np.ndarray) -> None:
+    """NumPy fallback for :func:`_rolling_z_score_loop` when Numba is unavailable."""
+    out[:] = np.nan
+    if window < 2 or x.shape[0] < window:
+        return
+    windows = np.lib.stride_tricks.sliding_window_view(x, window)
+    mean = windows.mean(axis=1)
+    std = windows.std(axis=1, ddof=1)
+    # NaN in a window propagates; constant windows have no deviation
+    std[windows.max(axis=1) == windows.min(axis=1)] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[window - 1:] = (x[window - 1:] - mean) / std
+
+
+if HAS_NUMBA:
+    _rolling_z_score_impl = njit(cache=True, nogil=True)(_rolling_z_score_loop)
+else:
+    _rolling_z_score_impl = _rolling_z_score_numpy
+
+
+def _rolling_z_score_rows_loop(X, window, out):
+    """
+    Rolling Z-Score of every row of a 2-D array (rows are independent series).
+
+    Args:
+        X: C-contiguous float64 array, one series per row
+        window: Rolling window size
+        out: float64 output array, same shape as X (filled in place)
+    """
+    for i in prange(X.shape[0]):
+        _rolling_z_score_impl(X[i], window, out[i])
+
+
+if HAS_NUMBA:
+    _rolling_z_score_rows_impl = njit(cache=True, nogil=True, parallel=True)(_rolling_z_score_rows_loop)
+else:
+    _rolling_z_score_rows_impl = _rolling_z_score_rows_loop
+
+
+def rolling_z_score(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Compute the rolling Z-Score of a series.
+
+    Args:
+        x: Series values (oldest first, NaNs allowed)
+        window: Rolling window size
+
+    Returns:
+        float64 array of Z-Scores (NaN where undefined)
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    out = np.empty_like(x)
+    _rolling_z_score_impl(x, int(window), out)
+    return out
+
+
+def rolling_z_score_rows(X: np.ndarray, window: int) -> np.ndarray:
+    """
+    Compute the rolling Z-Score of many series at once, rows in parallel.
+
+    Args:
+        X: 2-D array, one series per row (oldest first, NaNs allowed)
+        window: Rolling window size
+
+    Returns:
+        float64 array of Z-Scores, same shape as X
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    out = np.empty_like(X)
+    _rolling_z_score_rows_impl(X, int(window), out)
+    return out
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation (or load the on-disk cache) ahead of the first call."""
+    rolling_z_score(np.zeros(4, dtype=np.float64), 2)
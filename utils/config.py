@@ -1,3 +1,5 @@
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
@@ -9,6 +11,55 @@ logger = get_logger(__name__)
 # Load .env file for local development
 load_dotenv()
 
+# Environment variables recognised without the ARBIBOT_ prefix -> config path
+_UNPREFIXED_OVERRIDES = (
+    ('TELEGRAM_API_ID', ('telegram', 'api_id')),
+    ('TELEGRAM_API_HASH', ('telegram', 'api_hash')),
+    ('BINGX_API_KEY', ('exchanges', 'bingx', 'api_key')),
+    ('BINGX_API_SECRET', ('exchanges', 'bingx', 'api_secret')),
+    ('BYBIT_API_KEY', ('exchanges', 'bybit', 'api_key')),
+    ('BYBIT_API_SECRET', ('exchanges', 'bybit', 'api_secret')),
+    ('TELEGRAM_SESSION_STRING', ('telegram', 'session_string')),
+)
+
+
+def _set_nested(config: dict, path: tuple, value) -> None:
+    """Set config[path[0]]...[path[-1]] = value, creating missing sections."""
+    current = config
+    for key in path[:-1]:
+        if key not in current:
+            current[key] = {}
+        current = current[key]
+    current[path[-1]] = value
+
+
+def _parse_env_value(value: str):
+    """Convert an env override to bool/int/float where it looks like one."""
+    lowered = value.lower()
+    if lowered == 'true':
+        return True
+    if lowered == 'false':
+        return False
+    try:
+        if '.' in value:
+            return float(value)
+        return int(value)
+    except ValueError:
+        return value
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a YAML config file.
+    
+    Cached on (path, mtime, size) so repeated get_config() calls skip the parse
+    until the file changes. Callers must copy the result before mutating it.
+    """
+    with open(path, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+
 def get_config(config_path: str = 'config/config.yaml'):
     """
     Load configuration from YAML file and override with environment variables.
@@ -21,64 +72,27 @@ def get_config(config_path: str = 'config/config.yaml'):
         logger.warning(f"Config file {config_path} not found. Using defaults/env vars.")
         config = {}
     else:
-        with open(path, 'r') as f:
-            config = yaml.safe_load(f) or {}
+        stat = path.stat()
+        # Deep copy: callers (and the env overrides below) mutate their config
+        config = copy.deepcopy(_parse_yaml(str(path.resolve()), stat.st_mtime_ns, stat.st_size))
 
     # Override with environment variables
     # Format: ARBIBOT_SECTION_KEY=value
     for env_key, env_val in os.environ.items():
         if env_key.startswith('ARBIBOT_'):
-            parts = env_key[8:].lower().split('_')
+            *sections, leaf = env_key[8:].lower().split('_')
             
             # Navigate/Create nested dicts
             current = config
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:
-                    # Try to convert to int/float/bool
-                    if env_val.lower() == 'true':
-                        env_val = True
-                    elif env_val.lower() == 'false':
-                        env_val = False
-                    else:
-                        try:
-                            if '.' in env_val:
-                                env_val = float(env_val)
-                            else:
-                                env_val = int(env_val)
-                        except ValueError:
-                            pass
-                    current[part] = env_val
-                else:
-                    if part not in current or not isinstance(current[part], dict):
-                        current[part] = {}
-                    current = current[part]
+            for part in sections:
+                if part not in current or not isinstance(current[part], dict):
+                    current[part] = {}
+                current = current[part]
+            current[leaf] = _parse_env_value(env_val)
 
     # Special common overrides for convenience (without prefix)
-    if 'TELEGRAM_API_ID' in os.environ:
-        if 'telegram' not in config: config['telegram'] = {}
-        config['telegram']['api_id'] = os.environ['TELEGRAM_API_ID']
-    if 'TELEGRAM_API_HASH' in os.environ:
-        if 'telegram' not in config: config['telegram'] = {}
-        config['telegram']['api_hash'] = os.environ['TELEGRAM_API_HASH']
-    if 'BINGX_API_KEY' in os.environ:
-        if 'exchanges' not in config: config['exchanges'] = {}
-        if 'bingx' not in config['exchanges']: config['exchanges']['bingx'] = {}
-        config['exchanges']['bingx']['api_key'] = os.environ['BINGX_API_KEY']
-    if 'BINGX_API_SECRET' in os.environ:
-        if 'exchanges' not in config: config['exchanges'] = {}
-        if 'bingx' not in config['exchanges']: config['exchanges']['bingx'] = {}
-        config['exchanges']['bingx']['api_secret'] = os.environ['BINGX_API_SECRET']
-    if 'BYBIT_API_KEY' in os.environ:
-        if 'exchanges' not in config: config['exchanges'] = {}
-        if 'bybit' not in config['exchanges']: config['exchanges']['bybit'] = {}
-        config['exchanges']['bybit']['api_key'] = os.environ['BYBIT_API_KEY']
-    if 'BYBIT_API_SECRET' in os.environ:
-        if 'exchanges' not in config: config['exchanges'] = {}
-        if 'bybit' not in config['exchanges']: config['exchanges']['bybit'] = {}
-        config['exchanges']['bybit']['api_secret'] = os.environ['BYBIT_API_SECRET']
-
-    if 'TELEGRAM_SESSION_STRING' in os.environ:
-        if 'telegram' not in config: config['telegram'] = {}
-        config['telegram']['session_string'] = os.environ['TELEGRAM_SESSION_STRING']
+    for env_key, key_path in _UNPREFIXED_OVERRIDES:
+        if env_key in os.environ:
+            _set_nested(config, key_path, os.environ[env_key])
 
     return config
@@ -0,0 +1,23 @@
+"""
+Event loop setup for headless entry points
+"""
+
+import asyncio
+
+
+def install_uvloop() -> str:
+    """
+    Switch asyncio to uvloop's event loop policy when uvloop is installed.
+    
+    uvloop is optional (unavailable on Windows); the default policy is kept
+    when it cannot be imported. Not used for the GUI, which runs on qasync.
+    
+    Returns:
+        Class name of the active event loop policy
+    """
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    return asyncio.get_event_loop_policy().__class__.__name__
@@ -2,11 +2,66 @@
 Centralized logging configuration for ArbiBot
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+class _RoutedQueueHandler(QueueHandler):
+    """Queue handler that tags each record with the logger it was set up for."""
+    
+    def __init__(self, log_queue, route: str):
+        super().__init__(log_queue)
+        self.route = route
+    
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.log_route = self.route
+        return record
+
+
+class _RoutingListener(QueueListener):
+    """Single writer thread that hands each record to its logger's handlers."""
+    
+    def handle(self, record):
+        record = self.prepare(record)
+        for handler in _routes.get(getattr(record, 'log_route', record.name), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+# All loggers set up here share one queue and one writer thread; the file and
+# console handlers of each logger are kept per logger name in _routes
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_routes: Dict[str, List[logging.Handler]] = {}
+_listener = _RoutingListener(_queue)
+_listener_lock = threading.Lock()
+_listener_started = False
+
+
+def _ensure_listener() -> None:
+    """Start the shared writer thread on first use."""
+    global _listener_started
+    with _listener_lock:
+        if not _listener_started:
+            _listener.start()
+            _listener_started = True
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener_started
+    with _listener_lock:
+        if _listener_started:
+            _listener.stop()
+            _listener_started = False
 
 
 def setup_logger(name: str = 'arbibot', 
@@ -16,6 +71,11 @@ def setup_logger(name: str = 'arbibot',
     """
     Setup centralized logger with file and console output.
     
+    The logger itself only enqueues records; one background QueueListener thread,
+    shared by all loggers, does the file and console writes, so logging never
+    blocks the event loop on disk or terminal I/O and console lines never
+    interleave.
+    
     Args:
         name: Logger name
         log_dir: Directory for log files
@@ -25,18 +85,19 @@ def setup_logger(name: str = 'arbibot',
     Returns:
         Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    log_path = Path(log_dir)
-    log_path.mkdir(exist_ok=True)
-    
-    # Create logger
+    # Create logger (the level is applied on every call; handlers only once)
+    log_level = getattr(logging, level.upper())
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(log_level)
     
     # Prevent duplicate handlers
     if logger.handlers:
         return logger
     
+    # Create logs directory if it doesn't exist
+    log_path = Path(log_dir)
+    log_path.mkdir(exist_ok=True)
+    
     # Formatter
     formatter = logging.Formatter(
         '%(asctime)s | %(name)s | %(levelname)s | %(message)s',
@@ -49,16 +110,17 @@ def setup_logger(name: str = 'arbibot',
         log_file,
         maxBytes=10 * 1024 * 1024,  # 10 MB
         backupCount=5,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True  # Open on the first record
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    handlers = [file_handler]
     
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
+        console_handler.setLevel(log_level)
         
         # Colored formatter for console
         console_formatter = ColoredFormatter(
@@ -66,7 +128,12 @@ def setup_logger(name: str = 'arbibot',
             datefmt='%H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Register the handlers before the first record can reach the writer thread
+    _routes[name] = handlers
+    _ensure_listener()
+    logger.addHandler(_RoutedQueueHandler(_queue, name))
     
     return logger
 
@@ -74,6 +141,11 @@ def setup_logger(name: str = 'arbibot',
 class ColoredFormatter(logging.Formatter):
     """
     Colored log formatter for terminal output
+    
+    Hot-path messages use plain ASCII tags such as ``[ENTRY]``; when writing to
+    an interactive terminal the matching emoji is prepended for readability.
+    Level colors are likewise only added on a terminal, so redirected output
+    (files, journald) gets plain text.
     """
     
     COLORS = {
@@ -85,10 +157,39 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    TAG_EMOJI = {
+        '[ENTRY]': '🔔',
+        '[EXIT]': '🔔',
+        '[WARN]': '⚠️',
+    }
+    
+    def __init__(self, *args, use_emoji: Optional[bool] = None,
+                 use_color: Optional[bool] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        is_tty = sys.stdout.isatty()
+        self.use_emoji = is_tty if use_emoji is None else use_emoji
+        self.use_color = is_tty if use_color is None else use_color
+    
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        if self.use_color:
+            # Color a copy of the level name only for this output; other handlers
+            # formatting the same record must see the plain name
+            levelname = record.levelname
+            log_color = self.COLORS.get(levelname, self.RESET)
+            record.levelname = f"{log_color}{levelname}{self.RESET}"
+            try:
+                message = super().format(record)
+            finally:
+                record.levelname = levelname
+        else:
+            message = super().format(record)
+        
+        if self.use_emoji and isinstance(record.msg, str) and record.msg.startswith('['):
+            tag = record.msg.split(' ', 1)[0]
+            emoji = self.TAG_EMOJI.get(tag)
+            if emoji:
+                message = message.replace(tag, f"{emoji} {tag}", 1)
+        return message
 
 
 def get_logger(name: str = 'arbibot') -> logging.Logger:
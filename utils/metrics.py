@@ -2,12 +2,36 @@
 Statistical metrics for arbitrage analysis
 """
 
+import hashlib
+from collections import OrderedDict
+
 import pandas as pd
 import numpy as np
-from statsmodels.tsa.stattools import adfuller
 from typing import Tuple, Optional
 
 
+def _statsmodels_adf():
+    """
+    Import statsmodels' ADF functions on first use.
+    
+    statsmodels (and the scipy.stats it pulls in) takes over a second to import;
+    callers that only need spreads or Z-Scores should not pay for it.
+    
+    Returns:
+        Tuple of (adfuller, mackinnonp, mackinnoncrit)
+    """
+    from statsmodels.tsa.stattools import adfuller
+    from statsmodels.tsa.adfvalues import mackinnonp, mackinnoncrit
+    return adfuller, mackinnonp, mackinnoncrit
+
+
+# Recent ADF results keyed by a digest of the input series. The same candles are
+# often tested again (repeat signals, rescans within one bar), and the regression
+# costs far more than hashing the data
+_ADF_CACHE: OrderedDict = OrderedDict()
+_ADF_CACHE_MAX_ENTRIES = 512
+
+
 def calculate_spread(price_a: float, price_b: float, mode: str = 'absolute') -> float:
     """
     Calculate price spread between two exchanges.
@@ -34,6 +58,8 @@ def calculate_net_spread(gross_spread: float, price: float, taker_fee_a: float,
     
     Net Spread = Gross Spread - Total Trading Fees
     
+    Accepts scalars or NumPy arrays (element-wise, same rules per element).
+    
     Args:
         gross_spread: Raw price difference between exchanges (absolute value)
         price: Reference price for fee calculation (typically mid-price)
@@ -46,12 +72,21 @@ def calculate_net_spread(gross_spread: float, price: float, taker_fee_a: float,
             - net_spread_pct: Net spread as percentage
             - fee_cost: Total fee cost in absolute terms (USD)
     """
-    if price <= 0:
-        return 0.0, 0.0, 0.0
-    
     # Calculate total round-trip fee rate (buy on one exchange, sell on other)
     total_fee_rate = taker_fee_a + taker_fee_b
     
+    if np.ndim(price) > 0:
+        # Array path: rows with a non-positive price come out as zeros, like the scalar path
+        price = np.asarray(price, dtype=np.float64)
+        valid = price > 0
+        fee_cost = np.where(valid, price * total_fee_rate, 0.0)
+        net_spread_val = np.where(valid, np.asarray(gross_spread, dtype=np.float64) - fee_cost, 0.0)
+        net_spread_pct = np.divide(net_spread_val, price, out=np.zeros_like(net_spread_val), where=valid) * 100
+        return net_spread_val, net_spread_pct, fee_cost
+    
+    if price <= 0:
+        return 0.0, 0.0, 0.0
+    
     # Calculate fee cost in absolute terms
     fee_cost = price * total_fee_rate
     
@@ -75,13 +110,35 @@ def calculate_z_score(data: pd.Series, window: int = 20) -> pd.Series:
     Returns:
         Pandas Series with Z-Score values
     """
-    roll_mean = data.rolling(window=window).mean()
-    roll_std = data.rolling(window=window).std()
+    # Kernels import lazily: numba alone outweighs the rest of this module
+    from utils._stats_kernels import rolling_z_score
     
-    # Avoid division by zero
-    z_score = (data - roll_mean) / roll_std.replace(0, np.nan)
+    # Single pass over the values (sample std, NaN for incomplete or constant windows)
+    z_score = rolling_z_score(data.to_numpy(dtype=np.float64), window)
     
-    return z_score
+    return pd.Series(z_score, index=data.index, name=data.name)
+
+
+def calculate_z_score_batch(data: pd.DataFrame, window: int = 20) -> pd.DataFrame:
+    """
+    Calculate rolling Z-Scores for many spread series at once.
+    
+    Same values as calculate_z_score on each column; the columns are processed
+    in parallel.
+    
+    Args:
+        data: DataFrame with one spread series per column (rows are time)
+        window: Rolling window size (default 20 periods)
+    
+    Returns:
+        DataFrame of Z-Score values with the same index and columns
+    """
+    from utils._stats_kernels import rolling_z_score_rows
+    
+    # One row per series so each one is contiguous for its kernel thread
+    z_scores = rolling_z_score_rows(data.to_numpy(dtype=np.float64).T, window)
+    
+    return pd.DataFrame(z_scores.T, index=data.index, columns=data.columns)
 
 
 def calculate_latest_z_score(data: list, window: int = 20) -> float:
@@ -136,13 +193,42 @@ def adf_test(series: pd.Series, significance_level: float = 0.05) -> Tuple[bool,
         return False, 1.0, {'error': 'Insufficient data for ADF test'}
     
     try:
-        result = adfuller(clean_series, autolag='AIC')
-        
-        adf_statistic = result[0]
-        p_value = result[1]
-        used_lag = result[2]
-        n_obs = result[3]
-        critical_values = result[4]
+        values = clean_series.to_numpy()
+        key = (values.dtype.str, hashlib.blake2b(values.tobytes(), digest_size=16).digest())
+        cached = _ADF_CACHE.get(key)
+        if cached is not None:
+            _ADF_CACHE.move_to_end(key)
+            adf_statistic, p_value, used_lag, n_obs, critical_values = cached
+        else:
+            from utils._adf_kernels import HAS_NUMBA, adf_regression
+            
+            adfuller, mackinnonp, mackinnoncrit = _statsmodels_adf()
+            regression = None
+            if HAS_NUMBA:
+                try:
+                    # Compiled regression; p-value and critical values as in adfuller
+                    regression = adf_regression(values)
+                except (ValueError, np.linalg.LinAlgError):
+                    # Edge case (e.g. rank-deficient lags) left to statsmodels below
+                    regression = None
+            
+            if regression is not None:
+                adf_statistic, used_lag, n_obs = regression
+                p_value = mackinnonp(adf_statistic, regression='c', N=1)
+                crit = mackinnoncrit(N=1, regression='c', nobs=n_obs)
+                critical_values = {'1%': crit[0], '5%': crit[1], '10%': crit[2]}
+            else:
+                result = adfuller(clean_series, autolag='AIC')
+                
+                adf_statistic = result[0]
+                p_value = result[1]
+                used_lag = result[2]
+                n_obs = result[3]
+                critical_values = result[4]
+            
+            _ADF_CACHE[key] = (adf_statistic, p_value, used_lag, n_obs, critical_values)
+            if len(_ADF_CACHE) > _ADF_CACHE_MAX_ENTRIES:
+                _ADF_CACHE.popitem(last=False)
         
         is_stationary = p_value < significance_level
         
@@ -151,7 +237,7 @@ def adf_test(series: pd.Series, significance_level: float = 0.05) -> Tuple[bool,
             'p_value': p_value,
             'used_lag': used_lag,
             'n_observations': n_obs,
-            'critical_values': critical_values,
+            'critical_values': dict(critical_values),
             'is_stationary': is_stationary
         }
         
@@ -161,6 +247,37 @@ def adf_test(series: pd.Series, significance_level: float = 0.05) -> Tuple[bool,
         return False, 1.0, {'error': str(e)}
 
 
+def warm_up() -> None:
+    """Compile (or load from the on-disk cache) the kernels behind adf_test and calculate_z_score."""
+    from utils._adf_kernels import warm_up as warm_up_adf
+    from utils._stats_kernels import warm_up as warm_up_stats
+    
+    _statsmodels_adf()
+    warm_up_adf()
+    warm_up_stats()
+
+
+def spread_statistics(spread: np.ndarray, window: int = 20,
+                      significance_level: float = 0.05) -> Tuple[bool, float, np.ndarray]:
+    """
+    Run the CPU-bound part of historical validation on a spread series.
+    
+    Module-level and array-based so it can be shipped to a ProcessPoolExecutor.
+    
+    Args:
+        spread: Spread values (oldest first)
+        window: Rolling window size for the Z-Score
+        significance_level: P-value threshold for the ADF test
+    
+    Returns:
+        Tuple of (is_stationary, adf_pvalue, rolling Z-Score values)
+    """
+    series = pd.Series(spread)
+    is_stationary, p_value, _ = adf_test(series, significance_level)
+    z_score = calculate_z_score(series, window=window)
+    return is_stationary, p_value, z_score.to_numpy()
+
+
 def calculate_spread_stats(spread_series: pd.Series, price: Optional[float] = None, 
                           taker_fee_a: Optional[float] = None, 
                           taker_fee_b: Optional[float] = None) -> dict:
@@ -176,19 +293,22 @@ def calculate_spread_stats(spread_series: pd.Series, price: Optional[float] = No
     Returns:
         Dict with statistics (includes net spread stats if fees provided)
     """
-    clean_data = spread_series.dropna()
+    values = spread_series.to_numpy(dtype=np.float64)
+    clean_data = values[~np.isnan(values)]
+    count = clean_data.shape[0]
     
-    if len(clean_data) == 0:
+    if count == 0:
         return {'error': 'No data available'}
     
+    # Plain NumPy reductions on one array instead of a pandas call per statistic
     stats = {
         'gross_mean': clean_data.mean(),
-        'gross_std': clean_data.std(),
+        'gross_std': clean_data.std(ddof=1) if count > 1 else np.nan,
         'gross_min': clean_data.min(),
         'gross_max': clean_data.max(),
-        'gross_current': clean_data.iloc[-1] if len(clean_data) > 0 else None,
-        'gross_median': clean_data.median(),
-        'count': len(clean_data)
+        'gross_current': clean_data[-1],
+        'gross_median': np.median(clean_data),
+        'count': count
     }
     
     # Calculate net spread statistics if fees are provided
@@ -196,15 +316,15 @@ def calculate_spread_stats(spread_series: pd.Series, price: Optional[float] = No
         total_fee_rate = taker_fee_a + taker_fee_b
         fee_cost = price * total_fee_rate
         
-        net_data = clean_data - fee_cost
-        
+        # Net spread is the gross series shifted by a constant fee: derive its
+        # statistics instead of building and scanning a second series
         stats.update({
-            'net_mean': net_data.mean(),
-            'net_std': net_data.std(),
-            'net_min': net_data.min(),
-            'net_max': net_data.max(),
-            'net_current': net_data.iloc[-1] if len(net_data) > 0 else None,
-            'net_median': net_data.median(),
+            'net_mean': stats['gross_mean'] - fee_cost,
+            'net_std': stats['gross_std'],
+            'net_min': stats['gross_min'] - fee_cost,
+            'net_max': stats['gross_max'] - fee_cost,
+            'net_current': stats['gross_current'] - fee_cost,
+            'net_median': stats['gross_median'] - fee_cost,
             'fee_cost': fee_cost,
             'fee_pct': total_fee_rate * 100
         })
@@ -262,3 +382,43 @@ def is_exit_signal(z_score: float, exit_threshold: float = 0.5) -> Tuple[bool, s
         return True, f"Exit signal: Z-Score converged to {z_score:.2f}"
     
     return False, f"Hold position: Z={z_score:.2f}"
+
+
+def is_entry_signal_batch(z_scores: np.ndarray, threshold: float = 2.0,
+                          spread_pcts: Optional[np.ndarray] = None,
+                          min_spread_pct: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized is_entry_signal over many pairs (or ticks) at once.
+    
+    Args:
+        z_scores: Z-Score values
+        threshold: Z-Score threshold for entry (default 2.0)
+        spread_pcts: Spread percentages, same shape as z_scores (optional)
+        min_spread_pct: Minimum spread percentage to cover fees
+    
+    Returns:
+        Tuple of (should_enter, direction):
+            - should_enter: Boolean mask, same rules as is_entry_signal
+            - direction: 1 for SHORT A / LONG B (Z > 0), -1 for LONG A / SHORT B
+    """
+    z_scores = np.asarray(z_scores, dtype=np.float64)
+    # NaN compares False, so NaN Z-Scores never enter
+    should_enter = np.abs(z_scores) >= threshold
+    if spread_pcts is not None:
+        should_enter &= ~(np.asarray(spread_pcts, dtype=np.float64) < min_spread_pct)
+    direction = np.where(z_scores > 0, 1, -1).astype(np.int8)
+    return should_enter, direction
+
+
+def is_exit_signal_batch(z_scores: np.ndarray, exit_threshold: float = 0.5) -> np.ndarray:
+    """
+    Vectorized is_exit_signal over many pairs (or ticks) at once.
+    
+    Args:
+        z_scores: Z-Score values
+        exit_threshold: Z-Score threshold for exit (default 0.5)
+    
+    Returns:
+        Boolean mask, same rules as is_exit_signal (NaN never exits)
+    """
+    return np.abs(np.asarray(z_scores, dtype=np.float64)) <= exit_threshold
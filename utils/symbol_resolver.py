@@ -5,7 +5,9 @@ Provides robust resolution of generic trading pairs (e.g., 'BTC/USDT') to
 exchange-specific market symbols (e.g., 'BTC/USDT:USDT' or 'BDXN/USDT').
 """
 
-from typing import Dict, List, Optional
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
 import ccxt
 from utils.logger import get_logger
 
@@ -14,34 +16,86 @@ class SymbolResolver:
     Resolves and caches exchange-specific symbols.
     """
     
+    # Seconds to remember that a symbol is not listed (new listings appear over time)
+    MISS_TTL = 300.0
+    
     def __init__(self, config: Optional[dict] = None):
         self.logger = get_logger(__name__)
         self.config = config or {}
-        self.cache: Dict[str, Dict[str, str]] = {} # exchange -> {query -> actual}
+        self.cache: Dict[Tuple[str, str], str] = {} # (exchange, query) -> actual
+        self._misses: Dict[Tuple[str, str], float] = {} # (exchange, query) -> expiry (monotonic)
+        # exchange -> (symbols list it was built from, index); see _get_index
+        self._index: Dict[str, Tuple[List[str], Dict]] = {}
+        
+    def _get_index(self, exchange: ccxt.Exchange) -> Dict:
+        """
+        Return the discovery index for an exchange's current market list.
+        
+        Built in one pass over exchange.symbols and rebuilt when the list object
+        changes (markets reloaded). Maps the part before ':' of a settled symbol and
+        the cleaned (base, quote) pair to (position, symbol) of the first match, so
+        resolve() can keep the original "first symbol in market order" rule.
+        
+        Args:
+            exchange: CCXT exchange with markets loaded
+        
+        Returns:
+            Dict with 'settled' and 'pairs' lookup tables
+        """
+        ex_id = exchange.id
+        symbols = exchange.symbols
+        cached = self._index.get(ex_id)
+        if cached is not None and cached[0] is symbols:
+            return cached[1]
+        
+        settled: Dict[str, Tuple[int, str]] = {}
+        pairs: Dict[Tuple[str, str], Tuple[int, str]] = {}
+        for pos, sym in enumerate(symbols):
+            spot, sep, _ = sym.partition(':')
+            if sep:
+                settled.setdefault(spot, (pos, sym))
+            parts = sym.split('/')
+            if len(parts) == 2:
+                key = (parts[0].split(':')[0], parts[1].split(':')[0])
+                pairs.setdefault(key, (pos, sym))
+        
+        index = {'settled': settled, 'pairs': pairs}
+        self._index[ex_id] = (symbols, index)
+        return index
         
     async def resolve(self, exchange: ccxt.Exchange, query_symbol: str) -> Optional[str]:
         """
         Find the best match for a symbol on a specific exchange.
         """
         ex_id = exchange.id
-        if ex_id not in self.cache:
-            self.cache[ex_id] = {}
-            
-        if query_symbol in self.cache[ex_id]:
-            return self.cache[ex_id][query_symbol]
+        key = (ex_id, query_symbol)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Skip the full market scan for symbols recently found to be missing
+        expiry = self._misses.get(key)
+        if expiry is not None:
+            if time.monotonic() < expiry:
+                return None
+            del self._misses[key]
             
         # Ensure markets are loaded
         if exchange.symbols is None:
-            self.logger.info(f"🔄 Loading markets for {ex_id}...")
-            await exchange.load_markets()
+            self.logger.info("🔄 Loading markets for %s...", ex_id)
+            if asyncio.iscoroutinefunction(exchange.load_markets):
+                await exchange.load_markets()
+            else:
+                # Synchronous CCXT client: keep the blocking request off the loop
+                await asyncio.to_thread(exchange.load_markets)
             
         if exchange.symbols is None:
-            self.logger.error(f"❌ Failed to load markets for {ex_id}")
+            self.logger.error("❌ Failed to load markets for %s", ex_id)
             return None
             
         # 1. Exact match check
         if query_symbol in exchange.symbols:
-            self.cache[ex_id][query_symbol] = query_symbol
+            self.cache[key] = query_symbol
             return query_symbol
             
         # 2. Normalize components
@@ -57,26 +111,23 @@ class SymbolResolver:
             mapped_base = manual_map[base]
             mapped_query = f"{mapped_base}/{quote}"
             if mapped_query in exchange.symbols:
-                self.cache[ex_id][query_symbol] = mapped_query
+                self.cache[key] = mapped_query
                 return mapped_query
         
-        # 4. Discovery: Search through all symbols
-        # Case 1: Partial match (e.g. BDX -> BDXN or BDX/USDT -> BDX/USDT:USDT)
-        for sym in exchange.symbols:
-            # Check if it's the futures version of the same pair
-            if sym.startswith(f"{query_symbol}:"):
-                self.cache[ex_id][query_symbol] = sym
-                return sym
-            
-            # Check for renamed base (e.g. BDXN instead of BDX)
-            if '/' in sym:
-                s_base, s_quote = sym.split('/')
-                s_base_clean = s_base.split(':')[0] # Remove :USDT if present
-                
-                if s_base_clean == base:
-                    if s_quote.split(':')[0] == quote:
-                        self.logger.info(f"💡 SymbolResolver: Resolved {query_symbol} to {sym} on {ex_id}")
-                        self.cache[ex_id][query_symbol] = sym
-                        return sym
-                        
+        # 4. Discovery via the per-exchange index: the futures version of the same
+        # pair (BDX/USDT -> BDX/USDT:USDT) or the same base/quote once settlement
+        # suffixes are removed; whichever comes first in market order wins
+        index = self._get_index(exchange)
+        futures = index['settled'].get(query_symbol)
+        renamed = index['pairs'].get((base, quote))
+        if futures is not None and (renamed is None or futures[0] <= renamed[0]):
+            self.cache[key] = futures[1]
+            return futures[1]
+        if renamed is not None:
+            sym = renamed[1]
+            self.logger.info("💡 SymbolResolver: Resolved %s to %s on %s", query_symbol, sym, ex_id)
+            self.cache[key] = sym
+            return sym
+        
+        self._misses[key] = time.monotonic() + self.MISS_TTL
         return None